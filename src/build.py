@@ -0,0 +1,447 @@
+"""
+Build multi-file untuk program dan unit Pascal-S.
+
+Setiap file diawali 'program <nama>;' atau 'unit <nama>;', opsional diikuti
+'gunakan <unit>, ...;'. Builder membaca header semua file, membangun DAG
+dependensi, lalu meng-compile unit yang independen secara paralel di process
+pool sesuai urutan dependensi.
+
+Setiap unit menyimpan ringkasan interface (simbol yang diekspor). Unit hanya
+di-compile ulang jika source-nya berubah atau interface salah satu unit yang
+di-'gunakan' berubah, sehingga perubahan body saja tidak memaksa dependent-nya
+diparsing ulang.
+"""
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from lexer import Lexer
+from parser import Parser
+from serializer import write_tree
+
+CACHE_FILENAME = "build-cache.json"
+
+class BuildError(Exception):
+    """
+    Kesalahan pada level project: unit tidak ditemukan, nama ganda, atau dependensi siklik.
+    """
+
+def make_lexer():
+    # Import di sini supaya compiler.py bisa meng-import modul ini tanpa siklus
+    from compiler import PASCAL_S_KEYWORDS
+    return Lexer(None, PASCAL_S_KEYWORDS)
+
+def source_hash(source):
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+def read_header(source, path):
+    """
+    Membaca header file tanpa melakukan scanning seluruh source.
+    Mengembalikan (jenis, nama, daftar unit yang di-'gunakan').
+    """
+    tokens = make_lexer().scan_tokens(source)
+
+    def next_token():
+        return next(tokens, None)
+
+    def is_token(token, token_type, value=None):
+        return token is not None and token.type == token_type and \
+               (value is None or token.value.lower() == value)
+
+    kind = next_token()
+    name = next_token()
+    semicolon = next_token()
+    if not (is_token(kind, "KEYWORD", "program") or is_token(kind, "KEYWORD", "unit")) or \
+       not is_token(name, "IDENTIFIER") or not is_token(semicolon, "SEMICOLON"):
+        raise BuildError(f"Header 'program'/'unit' tidak valid pada file '{path}'")
+
+    uses = []
+    token = next_token()
+    if is_token(token, "KEYWORD", "gunakan"):
+        token = next_token()
+        while is_token(token, "IDENTIFIER"):
+            uses.append(token.value)
+            token = next_token()
+            if not is_token(token, "COMMA"):
+                break
+            token = next_token()
+        if not is_token(token, "SEMICOLON"):
+            raise BuildError(f"Klausa 'gunakan' tidak valid pada file '{path}'")
+    return kind.value.lower(), name.value, uses
+
+def node_text(node):
+    """
+    Menggabungkan nilai seluruh token di dalam subtree, misal 'larik [ 1 .. 10 ] dari integer'.
+    """
+    values = []
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if current.name.startswith("<"):
+            stack.extend(reversed(current.children))
+        else:
+            values.append(current.name.partition("(")[2][:-1])
+    return " ".join(values)
+
+def interface_summary(tree):
+    """
+    Simbol yang diekspor unit: deklarasi top-level beserta signature-nya, tanpa body subprogram.
+    """
+    symbols = {}
+    declarations = next(c for c in tree.children if c.name == "<declaration-part>")
+    for declaration in declarations.children:
+        children = declaration.children
+        if declaration.name == "<var-declaration>":
+            for i in range(1, len(children), 4):
+                type_text = node_text(children[i + 2])
+                for identifier in children[i].children[::2]:
+                    symbols[node_text(identifier).lower()] = f"variabel: {type_text}"
+        elif declaration.name in ("<const-declaration>", "<type-declaration>"):
+            kind = "konstanta" if declaration.name == "<const-declaration>" else "tipe"
+            for i in range(1, len(children), 4):
+                symbols[node_text(children[i]).lower()] = f"{kind} = {node_text(children[i + 2])}"
+        elif declaration.name == "<subprogram-declaration>":
+            for subprogram in children:
+                parts = subprogram.children
+                # Signature = semua anak sebelum SEMICOLON pertama setelah nama
+                end = next(i for i, c in enumerate(parts) if c.name == "SEMICOLON(;)")
+                symbols[node_text(parts[1]).lower()] = " ".join(node_text(c) for c in parts[:end])
+    return symbols
+
+def compile_unit(path, output_dir):
+    """
+    Dijalankan di worker process: lexing + parsing satu file, menulis parse tree
+    (format binary) ke output_dir, dan mengembalikan ringkasan interface-nya.
+    """
+    with open(path, 'r') as f:
+        source = f.read()
+    tokens = make_lexer().run_scanner(source)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            tree = Parser(tokens).parse()
+    except SyntaxError as e:
+        return {"error": str(e)}
+
+    name = node_text(tree.children[0].children[1])
+    write_tree(tree, os.path.join(output_dir, f"parsetree-{name}.bin"), "binary")
+    interface = interface_summary(tree)
+    interface_hash = source_hash(json.dumps(interface, sort_keys=True))
+    return {"interface": interface, "interface_hash": interface_hash}
+
+class Unit:
+    """
+    Satu file program/unit dalam project.
+    """
+    def __init__(self, path, kind, name, uses, source_hash):
+        self.path = path
+        self.kind = kind
+        self.name = name
+        self.uses = uses
+        self.source_hash = source_hash
+
+    @property
+    def key(self):
+        return self.name.lower()
+
+    @property
+    def dependencies(self):
+        return [u.lower() for u in self.uses]
+
+class BuildReport:
+    """
+    Ringkasan hasil satu kali build.
+    """
+    def __init__(self):
+        self.compiled = []
+        self.reused = []
+        self.failed = {}
+        self.skipped = []
+        self.elapsed = 0.0
+
+    @property
+    def ok(self):
+        return not self.failed and not self.skipped
+
+    def __str__(self):
+        lines = [
+            f"Build selesai dalam {self.elapsed:.3f} detik: "
+            f"{len(self.compiled)} di-compile, {len(self.reused)} dari cache, "
+            f"{len(self.failed)} gagal, {len(self.skipped)} dilewati."
+        ]
+        for name, error in self.failed.items():
+            lines.append(f"  [GAGAL] {name}: {error}")
+        for name in self.skipped:
+            lines.append(f"  [DILEWATI] {name}: dependensi gagal di-compile")
+        return "\n".join(lines)
+
+class Builder:
+    """
+    Merencanakan dan menjalankan build berurutan sesuai DAG dependensi.
+    """
+    def __init__(self, paths, output_dir, jobs=None):
+        self.paths = paths
+        self.output_dir = output_dir
+        self.jobs = jobs
+        self.cache_path = os.path.join(output_dir, CACHE_FILENAME)
+        self.cache = {}
+        self.units = {}
+
+    def load_cache(self):
+        if os.path.exists(self.cache_path):
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.cache = json.load(f).get("units", {})
+
+    def save_cache(self):
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump({"units": self.cache}, f, separators=(",", ":"))
+
+    def plan(self):
+        """
+        Membaca header setiap file (atau mengambilnya dari cache jika source tidak berubah)
+        dan memvalidasi DAG dependensi. Mengembalikan urutan topologis nama unit.
+        """
+        cached_by_path = {entry["path"]: entry for entry in self.cache.values()}
+        for path in self.paths:
+            with open(path, 'r') as f:
+                source = f.read()
+            digest = source_hash(source)
+
+            entry = cached_by_path.get(path)
+            if entry and entry["source_hash"] == digest:
+                unit = Unit(path, entry["kind"], entry["name"], entry["uses"], digest)
+            else:
+                unit = Unit(path, *read_header(source, path), digest)
+
+            if unit.key in self.units:
+                raise BuildError(f"Nama '{unit.name}' dideklarasikan di '{self.units[unit.key].path}' dan '{path}'")
+            self.units[unit.key] = unit
+
+        for unit in self.units.values():
+            for dependency in unit.dependencies:
+                if dependency not in self.units:
+                    raise BuildError(f"Unit '{dependency}' yang digunakan '{unit.name}' tidak ditemukan")
+                if self.units[dependency].kind != "unit":
+                    raise BuildError(f"'{unit.name}' tidak dapat menggunakan program '{dependency}'")
+
+        # Kahn's algorithm, sekaligus mendeteksi siklus
+        remaining = {key: len(set(unit.dependencies)) for key, unit in self.units.items()}
+        dependents = self.dependents()
+        order = [key for key, count in remaining.items() if count == 0]
+        for key in order:
+            for dependent in dependents[key]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    order.append(dependent)
+        if len(order) != len(self.units):
+            cycle = sorted(self.units[key].name for key, count in remaining.items() if count)
+            raise BuildError(f"Dependensi siklik antar unit: {', '.join(cycle)}")
+        return order
+
+    def dependents(self):
+        dependents = {key: [] for key in self.units}
+        for key, unit in self.units.items():
+            for dependency in set(unit.dependencies):
+                dependents[dependency].append(key)
+        return dependents
+
+    def is_up_to_date(self, unit, dependency_hashes):
+        entry = self.cache.get(unit.key)
+        return entry is not None and entry["path"] == unit.path and \
+               entry["source_hash"] == unit.source_hash and \
+               entry["dependency_hashes"] == dependency_hashes and \
+               os.path.exists(os.path.join(self.output_dir, f"parsetree-{entry['name']}.bin"))
+
+    def build(self):
+        report = BuildReport()
+        start = time.perf_counter()
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.load_cache()
+        self.plan()
+
+        dependents = self.dependents()
+        remaining = {key: set(unit.dependencies) for key, unit in self.units.items()}
+        ready = [key for key, deps in remaining.items() if not deps]
+        interface_hashes = {}
+        dependency_snapshot = {}
+
+        def finish(key, interface_hash):
+            interface_hashes[key] = interface_hash
+            for dependent in dependents[key]:
+                remaining[dependent].discard(key)
+                if not remaining[dependent]:
+                    ready.append(dependent)
+
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            running = {}
+            while ready or running:
+                while ready:
+                    unit = self.units[ready.pop()]
+                    dependency_hashes = {d: interface_hashes[d] for d in unit.dependencies}
+                    if self.is_up_to_date(unit, dependency_hashes):
+                        report.reused.append(unit.name)
+                        finish(unit.key, self.cache[unit.key]["interface_hash"])
+                        continue
+                    dependency_snapshot[unit.key] = dependency_hashes
+                    running[executor.submit(compile_unit, unit.path, self.output_dir)] = unit
+
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    unit = running.pop(future)
+                    result = future.result()
+                    if "error" in result:
+                        report.failed[unit.name] = result["error"]
+                        self.cache.pop(unit.key, None)
+                        continue
+
+                    report.compiled.append(unit.name)
+                    self.cache[unit.key] = {
+                        "path": unit.path, "kind": unit.kind, "name": unit.name,
+                        "uses": unit.uses, "source_hash": unit.source_hash,
+                        "interface": result["interface"],
+                        "interface_hash": result["interface_hash"],
+                        "dependency_hashes": dependency_snapshot[unit.key],
+                    }
+                    finish(unit.key, result["interface_hash"])
+
+        # Unit yang tidak pernah siap karena dependensinya gagal
+        report.skipped = sorted(
+            self.units[key].name for key in self.units
+            if key not in interface_hashes and self.units[key].name not in report.failed
+        )
+        # Entri cache untuk file yang sudah tidak ada di project dibuang
+        self.cache = {key: entry for key, entry in self.cache.items() if key in self.units}
+        self.save_cache()
+        report.elapsed = time.perf_counter() - start
+        return report
+
+def collect_sources(arguments):
+    paths = []
+    for argument in arguments:
+        if os.path.isdir(argument):
+            paths.extend(sorted(glob.glob(os.path.join(argument, "*.pas"))))
+        else:
+            paths.append(argument)
+    return [os.path.abspath(p) for p in paths]
+
+# --- BENCHMARK ---
+
+UNIT_TEMPLATE = """unit U{i};
+{uses}
+variabel
+  n{i}: integer;
+
+fungsi f{i}(x: integer): integer;
+variabel
+  k: integer;
+mulai
+  f{i} := 0;
+  untuk k := 1 ke x lakukan
+    f{i} := f{i} + k * {body};
+selesai;
+
+prosedur p{i}(a, b: integer);
+mulai
+  jika a > b maka
+    n{i} := a
+  selain_itu
+    n{i} := b;
+selesai;
+{extra}
+selesai.
+"""
+
+def write_synthetic_unit(directory, i, uses, body=1, extra=""):
+    uses_clause = f"gunakan {', '.join(f'U{d}' for d in uses)};" if uses else ""
+    with open(os.path.join(directory, f"u{i}.pas"), 'w') as f:
+        f.write(UNIT_TEMPLATE.format(i=i, uses=uses_clause, body=body, extra=extra))
+
+def generate_project(directory, count, fanout=3, seed=0):
+    """
+    Membuat project sintetis: count unit, masing-masing menggunakan hingga
+    fanout unit sebelumnya, ditambah satu program utama.
+    """
+    rng = random.Random(seed)
+    dependencies = {}
+    for i in range(count):
+        dependencies[i] = sorted(rng.sample(range(i), min(i, fanout)))
+        write_synthetic_unit(directory, i, dependencies[i])
+
+    last = range(max(0, count - fanout), count)
+    with open(os.path.join(directory, "main.pas"), 'w') as f:
+        f.write(f"program Utama;\ngunakan {', '.join(f'U{i}' for i in last)};\n"
+                "variabel\n  hasil: integer;\nmulai\n  hasil := 0;\nselesai.\n")
+    return dependencies
+
+def benchmark(count=1000, jobs=None):
+    directory = tempfile.mkdtemp(prefix="pascal-s-build-")
+    try:
+        dependencies = generate_project(directory, count)
+        output_dir = os.path.join(directory, "build")
+        paths = collect_sources([directory])
+        dependents_of_0 = sum(1 for deps in dependencies.values() if 0 in deps)
+
+        steps = [
+            ("build awal", None),
+            ("build ulang tanpa perubahan", None),
+            ("perubahan body U0", lambda: write_synthetic_unit(directory, 0, dependencies[0], body=2)),
+            (f"perubahan interface U0 ({dependents_of_0} dependent langsung)", lambda: write_synthetic_unit(
+                directory, 0, dependencies[0], body=2,
+                extra="\nprosedur baru;\nmulai\n  n0 := 0;\nselesai;\n")),
+        ]
+        print(f"Project sintetis: {count} unit + 1 program di {directory}")
+        for title, change in steps:
+            if change:
+                change()
+            report = Builder(paths, output_dir, jobs).build()
+            print(f"- {title}: {report}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def main():
+    args = sys.argv[1:]
+    jobs = None
+    if "--jobs" in args:
+        i = args.index("--jobs")
+        jobs = int(args[i + 1])
+        del args[i:i + 2]
+
+    if args and args[0] == "--bench":
+        benchmark(int(args[1]) if len(args) > 1 else 1000, jobs)
+        return
+
+    output_dir = None
+    if "--out" in args:
+        i = args.index("--out")
+        output_dir = args[i + 1]
+        del args[i:i + 2]
+
+    if not args:
+        print("Penggunaan: python build.py [Folder/Kode Pascal ...] [--out Folder] [--jobs N] | --bench [N]")
+        return
+
+    paths = collect_sources(args)
+    if output_dir is None:
+        base = args[0] if os.path.isdir(args[0]) else os.path.dirname(os.path.abspath(args[0]))
+        output_dir = os.path.join(base, "build")
+
+    try:
+        report = Builder(paths, output_dir, jobs).build()
+    except BuildError as e:
+        print(f"[BUILD GAGAL] {e}")
+        raise SystemExit(1)
+    print(report)
+    if not report.ok:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Pengecekan regresi waktu startup CLI berbasis `python -X importtime`.
+
+Script ini menjalankan compiler.py untuk setiap program kecil di
+test/milestone-1/input (dengan .pyc yang sudah di-compile), menjumlahkan waktu
+import top-level, lalu keluar dengan status 1 jika melebihi budget. Import
+bawaan startup interpreter (site, encodings, dst., diukur dengan
+`python -X importtime -c pass`) tidak dihitung karena bergantung pada
+environment, bukan pada project ini. Sebelumnya dicek juga bahwa
+dfa_tables.py masih sesuai dengan dfa_rules.json (gen_dfa_tables.py --check).
+
+    python src/check_startup.py [budget_ms]
+"""
+import compileall
+import glob
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from gen_dfa_tables import check as check_dfa_tables
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+INPUT_DIR = os.path.join(SRC_DIR, "..", "test", "milestone-1", "input")
+
+# Total waktu import project (ms, tanpa import bawaan interpreter) yang
+# diperbolehkan untuk satu kali startup CLI
+BUDGET_MS = 8.0
+
+# Jumlah pengulangan per file, diambil yang tercepat untuk meredam noise
+REPEAT = 5
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+def top_level_imports(stderr):
+    """
+    Mengembalikan [(nama modul, cumulative us)] untuk import top-level saja.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match and not match.group(3):
+            imports.append((match.group(4), int(match.group(2))))
+    return imports
+
+def importtime_env():
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+def baseline_modules():
+    """
+    Nama modul top-level yang sudah di-import interpreter sebelum script apa pun dijalankan.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "pass"],
+        capture_output=True, text=True, env=importtime_env(),
+    )
+    return {name for name, _ in top_level_imports(result.stderr)}
+
+def measure(pascal_file, baseline):
+    env = importtime_env()
+    best = None
+    for _ in range(REPEAT):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", os.path.join(SRC_DIR, "compiler.py"), pascal_file],
+            capture_output=True, text=True, env=env,
+        )
+        imports = [item for item in top_level_imports(result.stderr) if item[0] not in baseline]
+        total = sum(cumulative for _, cumulative in imports) / 1000
+        if best is None or total < best[0]:
+            best = (total, imports)
+    return best
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+
+    # Waktu startup hanya berarti jika tabel DFA bawaan masih sesuai dengan dfa_rules.json
+    check_dfa_tables()
+    # Startup diukur dengan .pyc yang sudah ada, seperti pada pemakaian normal
+    compileall.compile_dir(SRC_DIR, quiet=1)
+    baseline = baseline_modules()
+
+    # compiler.py menulis output ke ../output relatif terhadap input, jadi
+    # program disalin ke folder sementara supaya folder test tidak berubah
+    workdir = tempfile.mkdtemp(prefix="pascal-s-startup-")
+    failed = False
+    try:
+        os.makedirs(os.path.join(workdir, "input"))
+        for path in sorted(glob.glob(os.path.join(INPUT_DIR, "*.pas"))):
+            pascal_file = os.path.join(workdir, "input", os.path.basename(path))
+            shutil.copy(path, pascal_file)
+
+            total, imports = measure(pascal_file, baseline)
+            status = "OK" if total <= budget else "LEWAT BUDGET"
+            print(f"{os.path.basename(path):<14}{total:>8.2f} ms  [{status}]")
+            if total > budget:
+                failed = True
+                slowest = sorted(imports, key=lambda item: item[1], reverse=True)[:5]
+                for name, cumulative in slowest:
+                    print(f"    {name:<28}{cumulative / 1000:>8.2f} ms")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"Budget startup: {budget:.2f} ms")
+    if failed:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
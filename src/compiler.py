@@ -1,6 +1,5 @@
 import sys
 import os
-import io
 from lexer import Lexer
 from pascal_token import Token 
 from parser import Parser
@@ -10,20 +9,41 @@ PASCAL_S_KEYWORDS = [
     # Keyword
     "program", "var", "begin", "end", "if", "then", "else", "while", "do", 
     "for", "to", "downto", "integer", "real", "boolean", "char", "array", 
-    "of", "procedure", "function", "const", "type", "true", "false",
+    "of", "procedure", "function", "const", "type", "true", "false", "unit", "uses",
     # Padanan Bahasa Indonesia
     "program", "variabel", "mulai", "selesai", "jika", "maka", "selain_itu", "selama", "lakukan",
     "untuk", "ke", "turun_ke", "integer", "real", "boolean", "char", "larik",
-    "dari", "prosedur", "fungsi", "konstanta", "tipe", "true", "false"
+    "dari", "prosedur", "fungsi", "konstanta", "tipe", "true", "false", "unit", "gunakan"
 ]
 
 def main():
+    # Modul output di-import di sini, bukan di level modul, supaya modul lain yang
+    # hanya butuh PASCAL_S_KEYWORDS (transpiler, build) tetap ringan
+    from serializer import FORMATS, EXTENSIONS, write_tokens, write_tree, stream_tree, tee_tokens
+
     #Penerimaan Input File
-    if len(sys.argv) != 2:
-        print("Penggunaan: python compiler.py [Kode Pascal]")
+    args = sys.argv[1:]
+    output_format = "text"
+    write_index = "--index" in args
+    if write_index:
+        args.remove("--index")
+    # --stream: parse tree langsung ditulis ke file dari event parser, tanpa Node
+    stream = "--stream" in args
+    if stream:
+        args.remove("--stream")
+    if len(args) == 3 and args[1] == "--format" and args[2] in FORMATS:
+        output_format = args[2]
+        args = args[:1]
+
+    # Index dimuat ulang bersama parse tree lewat read_tree, yang tidak mendukung format text
+    if len(args) != 1 or (stream and write_index) or (write_index and output_format == "text"):
+        print(f"Penggunaan: python compiler.py [Kode Pascal] [--format {'|'.join(FORMATS)}] [--index | --stream]")
+        print("  --index: hanya untuk format ndjson/binary, parse tree format text tidak dapat dibaca ulang")
+        print("  --stream: memori sebanding kedalaman nesting untuk format ndjson/binary; format text")
+        print("            tetap menahan satu subtree anak root karena konektor tree baru diketahui belakangan")
         return
         
-    pascal_file = sys.argv[1]
+    pascal_file = args[0]
     
     if not os.path.exists(pascal_file) or not os.path.isfile(pascal_file):
             print(f"File input '{pascal_file}' tidak ditemukan atau bukan file yang valid.")
@@ -37,35 +57,59 @@ def main():
         print(f"Gagal membaca file input: {e}")
         return
 
-    #Inisialisasi Lexer
-    dfa_path = os.path.join(os.path.dirname(__file__), "dfa_rules.json")
+    #Inisialisasi Lexer (tabel DFA bawaan dari dfa_tables.py)
     try:
-        lexer = Lexer(dfa_path, PASCAL_S_KEYWORDS)
+        lexer = Lexer(None, PASCAL_S_KEYWORDS)
     except SystemExit:
         return
 
+    # Lokasi output: folder output di samping folder input
+    input_path = pascal_file 
+    input_filename = os.path.basename(input_path)
+    
+    milestone_dir = os.path.dirname(os.path.dirname(input_path)) 
+    
+    test_number = "".join(filter(str.isdigit, input_filename))
+    extension = EXTENSIONS[output_format]
+    output_filename = f"output-{test_number}{extension}"
+
+    output_dir = os.path.join(milestone_dir, "output")
+    output_path = os.path.join(output_dir, output_filename)
+    parsetree_output_path = os.path.join(output_dir, f"parsetree-{test_number}{extension}")
+
+    if stream:
+        # Lexer, file token, dan parse tree berjalan dalam satu aliran tanpa list token
+        from itertools import chain
+        scanned = lexer.scan_tokens(source_code)
+        first_token = next(scanned, None)
+        if first_token is None:
+            # Sama dengan jalur biasa: tanpa token, file token dan parse tree tidak ditulis
+            print("Tidak ada token yang dihasilkan oleh lexer.")
+            return
+        os.makedirs(output_dir, exist_ok=True)
+        token_stream = tee_tokens(chain((first_token,), scanned), output_path, output_format)
+        print("Memulai lexer dan parser (stream)...")
+        try:
+            stream_tree(token_stream, parsetree_output_path, output_format)
+            print(f"Parse tree (stream) berhasil ditulis ke: {parsetree_output_path}")
+        except SyntaxError as e:
+            print(f"\n[PARSING GAGAL] {e}")
+        finally:
+            # Token sisa tetap dibaca supaya file token lengkap seperti jalur biasa
+            for _ in token_stream:
+                pass
+        print(f"Output berhasil ditulis ke: {output_path}")
+        return
+
     # 4. Melakukan Scanning
     tokens = lexer.run_scanner(source_code)
 
     if tokens:
         # 5. Penghasilan Output Token ke File (Sesuai Milestone 1)
-        input_path = pascal_file 
-        input_filename = os.path.basename(input_path)
-        
-        milestone_dir = os.path.dirname(os.path.dirname(input_path)) 
-        
-        test_number = "".join(filter(str.isdigit, input_filename))
-        output_filename = f"output-{test_number}.txt"
-
-        output_dir = os.path.join(milestone_dir, "output")
         os.makedirs(output_dir, exist_ok=True)
 
-        output_path = os.path.join(output_dir, output_filename)
-
         try:
-            with open(output_path, 'w') as f:
-                for token in tokens:
-                    f.write(str(token) + '\n')
+            write_tokens(tokens, output_path, output_format)
             print(f"Output berhasil ditulis ke: {output_path}")
         except Exception as e:
             print(f"Gagal menulis file output token: {e}")
@@ -81,21 +125,14 @@ def main():
                 parse_tree.print_tree() 
 
                 try:
-                    parsetree_filename = f"parsetree-{test_number}.txt"
-                    parsetree_output_path = os.path.join(output_dir, parsetree_filename)
-                    
-                    f_buffer = io.StringIO()
-                    original_stdout = sys.stdout  
-                    sys.stdout = f_buffer         
-
-                    parse_tree.print_tree()
-                    
-                    sys.stdout = original_stdout
-                    tree_string = f_buffer.getvalue()
-                    
-                    with open(parsetree_output_path, 'w', encoding='utf-8') as f:
-                        f.write(tree_string)
+                    write_tree(parse_tree, parsetree_output_path, output_format)
                     print(f"Parse tree (format tree) berhasil ditulis ke: {parsetree_output_path}")
+
+                    if write_index:
+                        from tree_index import TreeIndex
+                        index_output_path = os.path.join(output_dir, f"index-{test_number}.json")
+                        TreeIndex(parse_tree).write(index_output_path)
+                        print(f"Index parse tree berhasil ditulis ke: {index_output_path}")
                 
                 except Exception as e:
                     print(f"Gagal menulis file parse tree: {e}")
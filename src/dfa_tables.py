@@ -0,0 +1,92 @@
+"""
+Tabel DFA bawaan Lexer. File ini di-generate oleh gen_dfa_tables.py dari
+dfa_rules.json, jangan diubah secara manual.
+"""
+
+DFA = {'start_state': 'S0',
+ 'final_states': {'S_ID': 'IDENTIFIER_CANDIDATE',
+                  'S_SEMI': 'SEMICOLON',
+                  'S_NUM': 'NUMBER',
+                  'S_REAL': 'NUMBER',
+                  'S_PLUS': 'ARITHMETIC_OPERATOR',
+                  'S_COMMA': 'COMMA',
+                  'S_COLON': 'COLON',
+                  'S_ASSIGN': 'ASSIGN_OPERATOR',
+                  'S_LPAREN': 'LPARENTHESIS',
+                  'S_RPAREN': 'RPARENTHESIS',
+                  'S_DOT': 'DOT',
+                  'S_RANGE': 'RANGE_OPERATOR',
+                  'S_STRING_END': 'STRING_LITERAL',
+                  'S_GT': 'RELATIONAL_OPERATOR',
+                  'S_GTE': 'RELATIONAL_OPERATOR',
+                  'S_LT': 'RELATIONAL_OPERATOR',
+                  'S_LTE': 'RELATIONAL_OPERATOR',
+                  'S_NEQ': 'RELATIONAL_OPERATOR',
+                  'S_EQ': 'RELATIONAL_OPERATOR',
+                  'S_MINUS': 'ARITHMETIC_OPERATOR',
+                  'S_MULT': 'ARITHMETIC_OPERATOR',
+                  'S_DIV': 'ARITHMETIC_OPERATOR',
+                  'S_LBRACKET': 'LBRACKET',
+                  'S_RBRACKET': 'RBRACKET'},
+ 'transitions': {'S0': {'letter': 'S_ID',
+                        ';': 'S_SEMI',
+                        'digit': 'S_NUM',
+                        '+': 'S_PLUS',
+                        ',': 'S_COMMA',
+                        ':': 'S_COLON',
+                        '(': 'S_LPAREN',
+                        ')': 'S_RPAREN',
+                        '.': 'S_DOT',
+                        "'": 'S_STRING',
+                        '>': 'S_GT',
+                        '<': 'S_LT',
+                        '=': 'S_EQ',
+                        '-': 'S_MINUS',
+                        '*': 'S_MULT',
+                        '/': 'S_DIV',
+                        '[': 'S_LBRACKET',
+                        ']': 'S_RBRACKET'},
+                 'S_ID': {'letter': 'S_ID', 'digit': 'S_ID', '_': 'S_ID'},
+                 'S_SEMI': {},
+                 'S_NUM': {'digit': 'S_NUM', '.': 'S_REAL_DOT'},
+                 'S_REAL_DOT': {'digit': 'S_REAL'},
+                 'S_REAL': {'digit': 'S_REAL'},
+                 'S_PLUS': {},
+                 'S_COMMA': {},
+                 'S_COLON': {'=': 'S_ASSIGN'},
+                 'S_ASSIGN': {},
+                 'S_LPAREN': {},
+                 'S_RPAREN': {},
+                 'S_DOT': {'.': 'S_RANGE'},
+                 'S_RANGE': {},
+                 'S_STRING': {'letter': 'S_STRING',
+                              'digit': 'S_STRING',
+                              ' ': 'S_STRING',
+                              '=': 'S_STRING',
+                              '+': 'S_STRING',
+                              '-': 'S_STRING',
+                              '*': 'S_STRING',
+                              '/': 'S_STRING',
+                              '(': 'S_STRING',
+                              ')': 'S_STRING',
+                              ',': 'S_STRING',
+                              '.': 'S_STRING',
+                              ':': 'S_STRING',
+                              ';': 'S_STRING',
+                              '>': 'S_STRING',
+                              '<': 'S_STRING',
+                              '[': 'S_STRING',
+                              ']': 'S_STRING',
+                              "'": 'S_STRING_END'},
+                 'S_STRING_END': {},
+                 'S_GT': {'=': 'S_GTE'},
+                 'S_GTE': {},
+                 'S_LT': {'=': 'S_LTE', '>': 'S_NEQ'},
+                 'S_LTE': {},
+                 'S_NEQ': {},
+                 'S_EQ': {},
+                 'S_MINUS': {},
+                 'S_MULT': {},
+                 'S_DIV': {},
+                 'S_LBRACKET': {},
+                 'S_RBRACKET': {}}}
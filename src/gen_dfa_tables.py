@@ -0,0 +1,58 @@
+"""
+Membekukan dfa_rules.json menjadi modul Python dfa_tables.py supaya Lexer
+bawaan tidak perlu mem-parsing JSON setiap kali program dijalankan.
+
+Jalankan ulang setiap kali dfa_rules.json diubah:
+    python src/gen_dfa_tables.py
+
+Mengecek apakah dfa_tables.py masih sama dengan dfa_rules.json (status 1 jika tidak):
+    python src/gen_dfa_tables.py --check
+"""
+import json
+import os
+import pprint
+import sys
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+DFA_JSON_PATH = os.path.join(SRC_DIR, "dfa_rules.json")
+DFA_TABLES_PATH = os.path.join(SRC_DIR, "dfa_tables.py")
+
+HEADER = '''"""
+Tabel DFA bawaan Lexer. File ini di-generate oleh gen_dfa_tables.py dari
+dfa_rules.json, jangan diubah secara manual.
+"""
+'''
+
+def load_rules():
+    with open(DFA_JSON_PATH, 'r') as f:
+        return json.load(f)
+
+def tables_up_to_date():
+    """
+    CLI hanya membaca dfa_tables.py, jadi perubahan dfa_rules.json yang belum
+    di-generate ulang tidak akan terlihat tanpa pengecekan ini.
+    """
+    try:
+        from dfa_tables import DFA
+    except ImportError:
+        return False
+    return DFA == load_rules()
+
+def check():
+    if not tables_up_to_date():
+        print(f"{DFA_TABLES_PATH} tidak sesuai dengan {DFA_JSON_PATH}, jalankan: python src/gen_dfa_tables.py")
+        raise SystemExit(1)
+    print("Tabel DFA sesuai dengan dfa_rules.json")
+
+def main():
+    if sys.argv[1:] == ["--check"]:
+        check()
+        return
+    dfa = load_rules()
+    with open(DFA_TABLES_PATH, 'w') as f:
+        f.write(HEADER)
+        f.write(f"\nDFA = {pprint.pformat(dfa, sort_dicts=False)}\n")
+    print(f"Tabel DFA berhasil ditulis ke: {DFA_TABLES_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Generator tabel parsing prediktif dari pascal_s.grammar.
+
+Menghitung himpunan FIRST (hingga 2 token) dan FOLLOW, menyusun tabel LL(1),
+lalu menulis hasilnya ke parse_table.py untuk dipakai table_parser.py.
+Jalankan ulang setiap kali pascal_s.grammar diubah:
+    python src/gen_parse_table.py [--sets]
+
+Konflik LL(1) diselesaikan dengan dua aturan:
+- Jika satu alternatif diprediksi dari FIRST dan alternatif lain hanya dari
+  FOLLOW (produksi kosong), alternatif FIRST dipilih (greedy, seperti
+  'selain_itu' yang menempel ke 'jika' terdekat).
+- Jika beberapa alternatif diprediksi dari FIRST yang sama, sel tabel dipecah
+  berdasarkan token kedua (LL(2) lokal). Alternatif yang hanya terdiri dari
+  satu token menjadi default, misal IDENTIFIER biasa vs pemanggilan fungsi.
+"""
+import os
+import pprint
+import re
+import sys
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+GRAMMAR_PATH = os.path.join(SRC_DIR, "pascal_s.grammar")
+PARSE_TABLE_PATH = os.path.join(SRC_DIR, "parse_table.py")
+
+EPSILON = "ε"
+END = "$"
+WRAP_ACTION = re.compile(r"\{wrap (<[^>]+>)\}")
+
+HEADER = '''"""
+Tabel parsing prediktif Pascal-S. File ini di-generate oleh gen_parse_table.py
+dari pascal_s.grammar, jangan diubah secara manual.
+
+PRODUCTIONS berisi (lhs, rhs, wrap). TABLE[nonterminal][token] berisi indeks
+produksi, atau dict token kedua -> indeks produksi untuk sel LL(2). Kunci None
+adalah default (produksi kosong, atau alternatif satu token pada sel LL(2)).
+"""
+'''
+
+class GrammarError(Exception):
+    """
+    Grammar tidak valid atau mengandung konflik yang tidak bisa diselesaikan.
+    """
+
+def is_nonterminal(symbol, grammar):
+    return symbol in grammar
+
+def terminal_key(symbol):
+    # '&SEMICOLON:;' (predikat) memakai kunci yang sama dengan terminalnya
+    symbol = symbol.lstrip("&")
+    token_type, sep, value = symbol.partition(":")
+    return f"{token_type}:{value.lower()}" if sep else token_type
+
+def read_grammar(path):
+    """
+    Mengembalikan (simbol awal, {nonterminal: [(rhs, wrap), ...]}).
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = [line.rstrip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+    # Baris lanjutan (diawali '|') digabung dengan baris sebelumnya
+    rules = []
+    for line in lines:
+        if line.lstrip().startswith("|"):
+            if not rules:
+                raise GrammarError(f"Alternatif tanpa aturan: {line.strip()}")
+            rules[-1] += " " + line.strip()
+        else:
+            rules.append(line.strip())
+
+    grammar = {}
+    start = None
+    for rule in rules:
+        lhs, sep, rhs = rule.partition("::=")
+        lhs = lhs.strip()
+        if not sep or not lhs:
+            raise GrammarError(f"Aturan tidak valid: {rule}")
+        if lhs in grammar:
+            raise GrammarError(f"Nonterminal '{lhs}' didefinisikan lebih dari sekali")
+        start = start or lhs
+
+        alternatives = []
+        for alternative in rhs.split(" | "):
+            wrap = None
+            match = WRAP_ACTION.search(alternative)
+            if match:
+                wrap = match.group(1)
+                alternative = WRAP_ACTION.sub("", alternative)
+            symbols = tuple(s for s in alternative.split() if s != EPSILON)
+            alternatives.append((symbols, wrap))
+        grammar[lhs] = alternatives
+
+    for lhs, alternatives in grammar.items():
+        for symbols, _ in alternatives:
+            for symbol in symbols:
+                if (symbol.startswith("<") or symbol.islower()) and symbol not in grammar:
+                    raise GrammarError(f"Nonterminal '{symbol}' pada aturan '{lhs}' tidak didefinisikan")
+    return start, grammar
+
+def first_of(symbols, first, grammar, k=2):
+    """
+    FIRST_k dari deretan simbol: himpunan tuple kunci token dengan panjang <= k.
+    Tuple yang lebih pendek dari k berarti deretan bisa berakhir di situ.
+    """
+    result = {()}
+    for symbol in symbols:
+        if all(len(s) >= k for s in result):
+            break
+        symbol_first = first[symbol] if is_nonterminal(symbol, grammar) else {(terminal_key(symbol),)}
+        result = {a if len(a) >= k else (a + b)[:k] for a in result for b in symbol_first}
+    return result
+
+def compute_first(grammar, k=2):
+    first = {lhs: set() for lhs in grammar}
+    changed = True
+    while changed:
+        changed = False
+        for lhs, alternatives in grammar.items():
+            for symbols, _ in alternatives:
+                new = first_of(symbols, first, grammar, k) - first[lhs]
+                if new:
+                    first[lhs] |= new
+                    changed = True
+    return first
+
+def first1(strings):
+    return {s[0] for s in strings if s}
+
+def nullable(strings):
+    return () in strings
+
+def compute_follow(start, grammar, first):
+    follow = {lhs: set() for lhs in grammar}
+    follow[start].add(END)
+    changed = True
+    while changed:
+        changed = False
+        for lhs, alternatives in grammar.items():
+            for symbols, _ in alternatives:
+                for i, symbol in enumerate(symbols):
+                    if not is_nonterminal(symbol, grammar):
+                        continue
+                    rest = first_of(symbols[i + 1:], first, grammar, 1)
+                    new = first1(rest)
+                    if nullable(rest):
+                        new |= follow[lhs]
+                    if not new <= follow[symbol]:
+                        follow[symbol] |= new
+                        changed = True
+    return follow
+
+def build_table(start, grammar):
+    """
+    Mengembalikan (productions, table, resolved) dengan resolved berisi
+    daftar konflik yang diselesaikan secara greedy atau dengan token kedua.
+    """
+    first = compute_first(grammar)
+    follow = compute_follow(start, grammar, first)
+
+    productions = []
+    table = {}
+    resolved = []
+    for lhs, alternatives in grammar.items():
+        cells = {}
+        default = None
+        for symbols, wrap in alternatives:
+            index = len(productions)
+            productions.append((lhs, symbols, wrap))
+            strings = first_of(symbols, first, grammar)
+            for key in first1(strings):
+                cells.setdefault(key, []).append((index, "first"))
+            if nullable(strings):
+                if default is not None:
+                    raise GrammarError(f"'{lhs}' memiliki lebih dari satu alternatif kosong")
+                default = index
+                for key in follow[lhs]:
+                    cells.setdefault(key, []).append((index, "follow"))
+
+        row = {}
+        for key, candidates in cells.items():
+            row[key] = resolve_cell(lhs, key, candidates, productions, first, grammar, resolved)
+        if default is not None:
+            row[None] = default
+        check_overlap(lhs, row)
+        table[lhs] = row
+    return productions, table, resolved
+
+def resolve_cell(lhs, key, candidates, productions, first, grammar, resolved):
+    indexes = sorted({index for index, _ in candidates})
+    if len(indexes) == 1:
+        return indexes[0]
+
+    from_first = sorted({index for index, via in candidates if via == "first"})
+    if len(from_first) == 1:
+        resolved.append(f"{lhs} pada {key}: greedy, pilih alternatif {from_first[0]}")
+        return from_first[0]
+    if len(from_first) != len(indexes):
+        raise GrammarError(f"Konflik LL(1) pada '{lhs}' dengan token {key}")
+
+    # LL(2) lokal: pecah berdasarkan token kedua
+    cell = {}
+    for index in from_first:
+        for string in first_of(productions[index][1], first, grammar):
+            if not string or string[0] != key:
+                continue
+            second = string[1] if len(string) > 1 else None
+            if cell.get(second, index) != index:
+                raise GrammarError(f"Konflik LL(2) pada '{lhs}' dengan token {key} {second}")
+            cell[second] = index
+    resolved.append(f"{lhs} pada {key}: dipecah berdasarkan token kedua")
+    check_overlap(lhs, cell)
+    return cell
+
+def check_overlap(lhs, row):
+    # Kunci 'TIPE' dan 'TIPE:nilai' dalam satu baris harus memprediksi hal yang sama
+    for key, entry in row.items():
+        if key and ":" in key:
+            generic = key.partition(":")[0]
+            if generic in row and row[generic] != entry:
+                raise GrammarError(f"Konflik pada '{lhs}': {generic} dan {key} memprediksi alternatif berbeda")
+
+def main():
+    start, grammar = read_grammar(GRAMMAR_PATH)
+    productions, table, resolved = build_table(start, grammar)
+
+    if "--sets" in sys.argv[1:]:
+        first = compute_first(grammar)
+        follow = compute_follow(start, grammar, first)
+        for lhs in grammar:
+            first_set = sorted(first1(first[lhs]) | ({EPSILON} if nullable(first[lhs]) else set()))
+            print(f"{lhs}\n  FIRST  = {{{', '.join(first_set)}}}\n  FOLLOW = {{{', '.join(sorted(follow[lhs]))}}}")
+
+    with open(PARSE_TABLE_PATH, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        f.write(f"\nSTART = {start!r}\n")
+        f.write(f"\nPRODUCTIONS = {pprint.pformat(productions)}\n")
+        f.write(f"\nTABLE = {pprint.pformat(table)}\n")
+
+    for message in resolved:
+        print(f"Konflik diselesaikan: {message}")
+    print(f"Tabel parsing ({len(productions)} produksi) berhasil ditulis ke: {PARSE_TABLE_PATH}")
+
+if __name__ == "__main__":
+    main()
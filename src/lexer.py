@@ -1,15 +1,20 @@
-import json
 import os
 from pascal_token import Token
 
 class Lexer:
     """
     Melakukan analisis leksikal menggunakan DFA yang dimuat dari file.
+    Jika dfa_file_path None, dipakai tabel DFA bawaan yang sudah dibekukan di
+    dfa_tables.py (dimuat sebagai konstanta .pyc, tanpa parsing JSON).
     """
     
     def __init__(self, dfa_file_path, keyword_list):
         self.keywords = keyword_list
-        self.dfa = self.load_dfa(dfa_file_path)
+        if dfa_file_path is None:
+            from dfa_tables import DFA
+            self.dfa = DFA
+        else:
+            self.dfa = self.load_dfa(dfa_file_path)
     
         self.current_index = 0
         self.current_line = 1
@@ -20,6 +25,7 @@ class Lexer:
         Membaca dan memparsing file aturan DFA (JSON atau TXT).
         """
         #print(f"Menginisialisasi DFA dari: {file_path}")
+        import json
         try:
             with open(file_path, 'r') as f:
                 dfa_data = json.load(f)
@@ -85,9 +91,13 @@ class Lexer:
         """
         Melakukan scanning kode sumber huruf demi huruf menggunakan logika DFA.
         """
-        tokens = []
-        
+        return list(self.scan_tokens(source_code))
 
+    def scan_tokens(self, source_code):
+        """
+        Versi generator dari run_scanner: token dihasilkan satu per satu sehingga
+        pemanggil bisa berhenti lebih awal (misalnya hanya membaca header file).
+        """
         while self.current_index < len(source_code):
             token_start_line = self.current_line
             token_start_coloumn = self.current_coloumn
@@ -168,16 +178,14 @@ class Lexer:
             #Buat tokennya
             if longest_lexeme:
                 token_type = self.get_token_type(longest_lexeme, longest_finalstate)
-                tokens.append(Token(token_type, longest_lexeme, token_start_line, token_start_coloumn))
+                yield Token(token_type, longest_lexeme, token_start_line, token_start_coloumn)
 
                 #terus majuin poinnya ke posisi setelah token found
                 self.current_coloumn += len(longest_lexeme)
                 self.current_index = last_valid_index
             else:
                 # Lexical error unknown symbol
-                tokens.append(Token("LEXICAL_ERROR", char, token_start_line, token_start_coloumn))
+                yield Token("LEXICAL_ERROR", char, token_start_line, token_start_coloumn)
                 print(f"Simbol unknown '{char}' pada baris {token_start_line}")
                 self.current_index += 1
-                self.current_coloumn += 1
-        
-        return tokens
\ No newline at end of file
+                self.current_coloumn += 1
\ No newline at end of file
@@ -0,0 +1,486 @@
+"""
+Tabel parsing prediktif Pascal-S. File ini di-generate oleh gen_parse_table.py
+dari pascal_s.grammar, jangan diubah secara manual.
+
+PRODUCTIONS berisi (lhs, rhs, wrap). TABLE[nonterminal][token] berisi indeks
+produksi, atau dict token kedua -> indeks produksi untuk sel LL(2). Kunci None
+adalah default (produksi kosong, atau alternatif satu token pada sel LL(2)).
+"""
+
+START = 'source'
+
+PRODUCTIONS = [('source', ('<program>',), None),
+ ('source', ('<unit>',), None),
+ ('<program>',
+  ('<program-header>',
+   'uses-opt',
+   '<declaration-part>',
+   '<compound-statement>',
+   'DOT:.'),
+  None),
+ ('<unit>',
+  ('<unit-header>',
+   'uses-opt',
+   '<declaration-part>',
+   'KEYWORD:selesai',
+   'DOT:.'),
+  None),
+ ('<program-header>', ('KEYWORD:program', 'IDENTIFIER', 'SEMICOLON:;'), None),
+ ('<unit-header>', ('KEYWORD:unit', 'IDENTIFIER', 'SEMICOLON:;'), None),
+ ('uses-opt', ('<uses-clause>',), None),
+ ('uses-opt', (), None),
+ ('<uses-clause>',
+  ('KEYWORD:gunakan', '<identifier-list>', 'SEMICOLON:;'),
+  None),
+ ('<declaration-part>', ('declarations',), None),
+ ('declarations', ('declaration', 'declarations'), None),
+ ('declarations', (), None),
+ ('declaration', ('<var-declaration>',), None),
+ ('declaration', ('<const-declaration>',), None),
+ ('declaration', ('<type-declaration>',), None),
+ ('declaration', ('<subprogram-declaration>',), None),
+ ('<var-declaration>', ('KEYWORD:variabel', 'var-items'), None),
+ ('var-items',
+  ('<identifier-list>', 'COLON::', '<type>', 'SEMICOLON:;', 'var-items'),
+  None),
+ ('var-items', (), None),
+ ('<const-declaration>', ('KEYWORD:konstanta', 'const-items'), None),
+ ('const-items',
+  ('IDENTIFIER',
+   'RELATIONAL_OPERATOR:=',
+   'NUMBER',
+   'SEMICOLON:;',
+   'const-items'),
+  None),
+ ('const-items', (), None),
+ ('<type-declaration>', ('KEYWORD:tipe', 'type-items'), None),
+ ('type-items',
+  ('IDENTIFIER',
+   'RELATIONAL_OPERATOR:=',
+   '<type>',
+   'SEMICOLON:;',
+   'type-items'),
+  None),
+ ('type-items', (), None),
+ ('<subprogram-declaration>', ('subprogram', 'subprograms'), None),
+ ('subprograms', ('subprogram', 'subprograms'), None),
+ ('subprograms', (), None),
+ ('subprogram', ('<procedure-declaration>',), None),
+ ('subprogram', ('<function-declaration>',), None),
+ ('<procedure-declaration>',
+  ('KEYWORD:prosedur',
+   'IDENTIFIER',
+   'parameters-opt',
+   'SEMICOLON:;',
+   '<declaration-part>',
+   '<compound-statement>',
+   'SEMICOLON:;'),
+  None),
+ ('<function-declaration>',
+  ('KEYWORD:fungsi',
+   'IDENTIFIER',
+   'parameters-opt',
+   'COLON::',
+   '<type>',
+   'SEMICOLON:;',
+   '<declaration-part>',
+   '<compound-statement>',
+   'SEMICOLON:;'),
+  None),
+ ('parameters-opt', ('<formal-parameter-list>',), None),
+ ('parameters-opt', (), None),
+ ('<formal-parameter-list>',
+  ('LPARENTHESIS:(', '<parameter-group>', 'parameter-groups', 'RPARENTHESIS:)'),
+  None),
+ ('parameter-groups',
+  ('SEMICOLON:;', '<parameter-group>', 'parameter-groups'),
+  None),
+ ('parameter-groups', (), None),
+ ('<parameter-group>', ('<identifier-list>', 'COLON::', '<type>'), None),
+ ('<identifier-list>', ('IDENTIFIER', 'identifiers'), None),
+ ('identifiers', ('COMMA:,', 'IDENTIFIER', 'identifiers'), None),
+ ('identifiers', (), None),
+ ('<type>', ('KEYWORD:integer',), None),
+ ('<type>', ('KEYWORD:real',), None),
+ ('<type>', ('KEYWORD:boolean',), None),
+ ('<type>', ('KEYWORD:char',), None),
+ ('<type>',
+  ('KEYWORD:larik',
+   'LBRACKET:[',
+   '<range>',
+   'RBRACKET:]',
+   'KEYWORD:dari',
+   '<type>'),
+  None),
+ ('<type>', ('<expression>', 'subrange-opt'), None),
+ ('subrange-opt', ('RANGE_OPERATOR:..', '<expression>'), '<subrange-type>'),
+ ('subrange-opt', (), None),
+ ('<range>', ('<expression>', 'RANGE_OPERATOR:..', '<expression>'), None),
+ ('<compound-statement>',
+  ('KEYWORD:mulai', '<statement-list>', 'KEYWORD:selesai'),
+  None),
+ ('<statement-list>', ('statement', 'statements'), None),
+ ('statements', ('SEMICOLON:;', 'statement-after'), None),
+ ('statements', (), None),
+ ('statement-after', ('statement', 'statements'), None),
+ ('statement-after', (), None),
+ ('statement', ('<compound-statement>',), None),
+ ('statement', ('<if-statement>',), None),
+ ('statement', ('<while-statement>',), None),
+ ('statement', ('<for-statement>',), None),
+ ('statement', ('<assignment-statement>',), None),
+ ('statement', ('<procedure-call>',), None),
+ ('statement', ('<empty-statement>',), None),
+ ('<empty-statement>', ('&SEMICOLON:;',), None),
+ ('<assignment-statement>',
+  ('IDENTIFIER', 'index-opt', 'ASSIGN_OPERATOR::=', '<expression>'),
+  None),
+ ('index-opt', ('LBRACKET:[', '<expression>', 'RBRACKET:]'), None),
+ ('index-opt', (), None),
+ ('<if-statement>',
+  ('KEYWORD:jika', '<expression>', 'KEYWORD:maka', 'statement', 'else-opt'),
+  None),
+ ('else-opt', ('KEYWORD:selain_itu', 'statement'), None),
+ ('else-opt', (), None),
+ ('<while-statement>',
+  ('KEYWORD:selama', '<expression>', 'KEYWORD:lakukan', 'statement'),
+  None),
+ ('<for-statement>',
+  ('KEYWORD:untuk',
+   'IDENTIFIER',
+   'ASSIGN_OPERATOR::=',
+   '<expression>',
+   'direction',
+   '<expression>',
+   'KEYWORD:lakukan',
+   'statement'),
+  None),
+ ('direction', ('KEYWORD:ke',), None),
+ ('direction', ('KEYWORD:turun_ke',), None),
+ ('<procedure-call>',
+  ('IDENTIFIER', 'LPARENTHESIS:(', 'arguments-opt', 'RPARENTHESIS:)'),
+  None),
+ ('arguments-opt', ('<parameter-list>',), None),
+ ('arguments-opt', (), None),
+ ('<parameter-list>', ('<expression>', 'expressions'), None),
+ ('expressions', ('COMMA:,', '<expression>', 'expressions'), None),
+ ('expressions', (), None),
+ ('<expression>', ('<simple-expression>', 'relation-opt'), None),
+ ('relation-opt', ('RELATIONAL_OPERATOR', '<simple-expression>'), None),
+ ('relation-opt', (), None),
+ ('<simple-expression>', ('sign-opt', '<term>', 'additions'), None),
+ ('sign-opt', ('ARITHMETIC_OPERATOR:+',), None),
+ ('sign-opt', ('ARITHMETIC_OPERATOR:-',), None),
+ ('sign-opt', (), None),
+ ('additions', ('additive-operator', '<term>', 'additions'), None),
+ ('additions', (), None),
+ ('additive-operator', ('ARITHMETIC_OPERATOR:+',), None),
+ ('additive-operator', ('ARITHMETIC_OPERATOR:-',), None),
+ ('additive-operator', ('LOGICAL_OPERATOR:atau',), None),
+ ('<term>', ('<factor>', 'multiplications'), None),
+ ('multiplications',
+  ('multiplicative-operator', '<factor>', 'multiplications'),
+  None),
+ ('multiplications', (), None),
+ ('multiplicative-operator', ('ARITHMETIC_OPERATOR:*',), None),
+ ('multiplicative-operator', ('ARITHMETIC_OPERATOR:/',), None),
+ ('multiplicative-operator', ('ARITHMETIC_OPERATOR:bagi',), None),
+ ('multiplicative-operator', ('ARITHMETIC_OPERATOR:mod',), None),
+ ('multiplicative-operator', ('LOGICAL_OPERATOR:dan',), None),
+ ('<factor>', ('<function-call>',), None),
+ ('<factor>', ('IDENTIFIER', 'LBRACKET:[', '<expression>', 'RBRACKET:]'), None),
+ ('<factor>', ('IDENTIFIER',), None),
+ ('<factor>', ('NUMBER',), None),
+ ('<factor>', ('STRING_LITERAL',), None),
+ ('<factor>', ('CHAR_LITERAL',), None),
+ ('<factor>', ('KEYWORD:true',), None),
+ ('<factor>', ('KEYWORD:false',), None),
+ ('<factor>', ('LOGICAL_OPERATOR:tidak', '<factor>'), None),
+ ('<factor>', ('LPARENTHESIS:(', '<expression>', 'RPARENTHESIS:)'), None),
+ ('<function-call>',
+  ('IDENTIFIER', 'LPARENTHESIS:(', 'arguments-opt', 'RPARENTHESIS:)'),
+  None)]
+
+TABLE = {'<assignment-statement>': {'IDENTIFIER': 64},
+ '<compound-statement>': {'KEYWORD:mulai': 50},
+ '<const-declaration>': {'KEYWORD:konstanta': 19},
+ '<declaration-part>': {None: 9,
+                        'KEYWORD:fungsi': 9,
+                        'KEYWORD:konstanta': 9,
+                        'KEYWORD:mulai': 9,
+                        'KEYWORD:prosedur': 9,
+                        'KEYWORD:selesai': 9,
+                        'KEYWORD:tipe': 9,
+                        'KEYWORD:variabel': 9},
+ '<empty-statement>': {'SEMICOLON:;': 63},
+ '<expression>': {'ARITHMETIC_OPERATOR:+': 80,
+                  'ARITHMETIC_OPERATOR:-': 80,
+                  'CHAR_LITERAL': 80,
+                  'IDENTIFIER': 80,
+                  'KEYWORD:false': 80,
+                  'KEYWORD:true': 80,
+                  'LOGICAL_OPERATOR:tidak': 80,
+                  'LPARENTHESIS:(': 80,
+                  'NUMBER': 80,
+                  'STRING_LITERAL': 80},
+ '<factor>': {'CHAR_LITERAL': 105,
+              'IDENTIFIER': {None: 102,
+                             'LBRACKET:[': 101,
+                             'LPARENTHESIS:(': 100},
+              'KEYWORD:false': 107,
+              'KEYWORD:true': 106,
+              'LOGICAL_OPERATOR:tidak': 108,
+              'LPARENTHESIS:(': 109,
+              'NUMBER': 103,
+              'STRING_LITERAL': 104},
+ '<for-statement>': {'KEYWORD:untuk': 71},
+ '<formal-parameter-list>': {'LPARENTHESIS:(': 34},
+ '<function-call>': {'IDENTIFIER': 110},
+ '<function-declaration>': {'KEYWORD:fungsi': 31},
+ '<identifier-list>': {'IDENTIFIER': 38},
+ '<if-statement>': {'KEYWORD:jika': 67},
+ '<parameter-group>': {'IDENTIFIER': 37},
+ '<parameter-list>': {'ARITHMETIC_OPERATOR:+': 77,
+                      'ARITHMETIC_OPERATOR:-': 77,
+                      'CHAR_LITERAL': 77,
+                      'IDENTIFIER': 77,
+                      'KEYWORD:false': 77,
+                      'KEYWORD:true': 77,
+                      'LOGICAL_OPERATOR:tidak': 77,
+                      'LPARENTHESIS:(': 77,
+                      'NUMBER': 77,
+                      'STRING_LITERAL': 77},
+ '<procedure-call>': {'IDENTIFIER': 74},
+ '<procedure-declaration>': {'KEYWORD:prosedur': 30},
+ '<program-header>': {'KEYWORD:program': 4},
+ '<program>': {'KEYWORD:program': 2},
+ '<range>': {'ARITHMETIC_OPERATOR:+': 49,
+             'ARITHMETIC_OPERATOR:-': 49,
+             'CHAR_LITERAL': 49,
+             'IDENTIFIER': 49,
+             'KEYWORD:false': 49,
+             'KEYWORD:true': 49,
+             'LOGICAL_OPERATOR:tidak': 49,
+             'LPARENTHESIS:(': 49,
+             'NUMBER': 49,
+             'STRING_LITERAL': 49},
+ '<simple-expression>': {'ARITHMETIC_OPERATOR:+': 83,
+                         'ARITHMETIC_OPERATOR:-': 83,
+                         'CHAR_LITERAL': 83,
+                         'IDENTIFIER': 83,
+                         'KEYWORD:false': 83,
+                         'KEYWORD:true': 83,
+                         'LOGICAL_OPERATOR:tidak': 83,
+                         'LPARENTHESIS:(': 83,
+                         'NUMBER': 83,
+                         'STRING_LITERAL': 83},
+ '<statement-list>': {'IDENTIFIER': 51,
+                      'KEYWORD:jika': 51,
+                      'KEYWORD:mulai': 51,
+                      'KEYWORD:selama': 51,
+                      'KEYWORD:untuk': 51,
+                      'SEMICOLON:;': 51},
+ '<subprogram-declaration>': {'KEYWORD:fungsi': 25, 'KEYWORD:prosedur': 25},
+ '<term>': {'CHAR_LITERAL': 92,
+            'IDENTIFIER': 92,
+            'KEYWORD:false': 92,
+            'KEYWORD:true': 92,
+            'LOGICAL_OPERATOR:tidak': 92,
+            'LPARENTHESIS:(': 92,
+            'NUMBER': 92,
+            'STRING_LITERAL': 92},
+ '<type-declaration>': {'KEYWORD:tipe': 22},
+ '<type>': {'ARITHMETIC_OPERATOR:+': 46,
+            'ARITHMETIC_OPERATOR:-': 46,
+            'CHAR_LITERAL': 46,
+            'IDENTIFIER': 46,
+            'KEYWORD:boolean': 43,
+            'KEYWORD:char': 44,
+            'KEYWORD:false': 46,
+            'KEYWORD:integer': 41,
+            'KEYWORD:larik': 45,
+            'KEYWORD:real': 42,
+            'KEYWORD:true': 46,
+            'LOGICAL_OPERATOR:tidak': 46,
+            'LPARENTHESIS:(': 46,
+            'NUMBER': 46,
+            'STRING_LITERAL': 46},
+ '<unit-header>': {'KEYWORD:unit': 5},
+ '<unit>': {'KEYWORD:unit': 3},
+ '<uses-clause>': {'KEYWORD:gunakan': 8},
+ '<var-declaration>': {'KEYWORD:variabel': 16},
+ '<while-statement>': {'KEYWORD:selama': 70},
+ 'additions': {None: 88,
+               'ARITHMETIC_OPERATOR:+': 87,
+               'ARITHMETIC_OPERATOR:-': 87,
+               'COMMA:,': 88,
+               'KEYWORD:ke': 88,
+               'KEYWORD:lakukan': 88,
+               'KEYWORD:maka': 88,
+               'KEYWORD:selain_itu': 88,
+               'KEYWORD:selesai': 88,
+               'KEYWORD:turun_ke': 88,
+               'LOGICAL_OPERATOR:atau': 87,
+               'RANGE_OPERATOR:..': 88,
+               'RBRACKET:]': 88,
+               'RELATIONAL_OPERATOR': 88,
+               'RPARENTHESIS:)': 88,
+               'SEMICOLON:;': 88},
+ 'additive-operator': {'ARITHMETIC_OPERATOR:+': 89,
+                       'ARITHMETIC_OPERATOR:-': 90,
+                       'LOGICAL_OPERATOR:atau': 91},
+ 'arguments-opt': {None: 76,
+                   'ARITHMETIC_OPERATOR:+': 75,
+                   'ARITHMETIC_OPERATOR:-': 75,
+                   'CHAR_LITERAL': 75,
+                   'IDENTIFIER': 75,
+                   'KEYWORD:false': 75,
+                   'KEYWORD:true': 75,
+                   'LOGICAL_OPERATOR:tidak': 75,
+                   'LPARENTHESIS:(': 75,
+                   'NUMBER': 75,
+                   'RPARENTHESIS:)': 76,
+                   'STRING_LITERAL': 75},
+ 'const-items': {None: 21,
+                 'IDENTIFIER': 20,
+                 'KEYWORD:fungsi': 21,
+                 'KEYWORD:konstanta': 21,
+                 'KEYWORD:mulai': 21,
+                 'KEYWORD:prosedur': 21,
+                 'KEYWORD:selesai': 21,
+                 'KEYWORD:tipe': 21,
+                 'KEYWORD:variabel': 21},
+ 'declaration': {'KEYWORD:fungsi': 15,
+                 'KEYWORD:konstanta': 13,
+                 'KEYWORD:prosedur': 15,
+                 'KEYWORD:tipe': 14,
+                 'KEYWORD:variabel': 12},
+ 'declarations': {None: 11,
+                  'KEYWORD:fungsi': 10,
+                  'KEYWORD:konstanta': 10,
+                  'KEYWORD:mulai': 11,
+                  'KEYWORD:prosedur': 10,
+                  'KEYWORD:selesai': 11,
+                  'KEYWORD:tipe': 10,
+                  'KEYWORD:variabel': 10},
+ 'direction': {'KEYWORD:ke': 72, 'KEYWORD:turun_ke': 73},
+ 'else-opt': {None: 69,
+              'KEYWORD:selain_itu': 68,
+              'KEYWORD:selesai': 69,
+              'SEMICOLON:;': 69},
+ 'expressions': {None: 79, 'COMMA:,': 78, 'RPARENTHESIS:)': 79},
+ 'identifiers': {None: 40, 'COLON::': 40, 'COMMA:,': 39, 'SEMICOLON:;': 40},
+ 'index-opt': {None: 66, 'ASSIGN_OPERATOR::=': 66, 'LBRACKET:[': 65},
+ 'multiplications': {None: 94,
+                     'ARITHMETIC_OPERATOR:*': 93,
+                     'ARITHMETIC_OPERATOR:+': 94,
+                     'ARITHMETIC_OPERATOR:-': 94,
+                     'ARITHMETIC_OPERATOR:/': 93,
+                     'ARITHMETIC_OPERATOR:bagi': 93,
+                     'ARITHMETIC_OPERATOR:mod': 93,
+                     'COMMA:,': 94,
+                     'KEYWORD:ke': 94,
+                     'KEYWORD:lakukan': 94,
+                     'KEYWORD:maka': 94,
+                     'KEYWORD:selain_itu': 94,
+                     'KEYWORD:selesai': 94,
+                     'KEYWORD:turun_ke': 94,
+                     'LOGICAL_OPERATOR:atau': 94,
+                     'LOGICAL_OPERATOR:dan': 93,
+                     'RANGE_OPERATOR:..': 94,
+                     'RBRACKET:]': 94,
+                     'RELATIONAL_OPERATOR': 94,
+                     'RPARENTHESIS:)': 94,
+                     'SEMICOLON:;': 94},
+ 'multiplicative-operator': {'ARITHMETIC_OPERATOR:*': 95,
+                             'ARITHMETIC_OPERATOR:/': 96,
+                             'ARITHMETIC_OPERATOR:bagi': 97,
+                             'ARITHMETIC_OPERATOR:mod': 98,
+                             'LOGICAL_OPERATOR:dan': 99},
+ 'parameter-groups': {None: 36, 'RPARENTHESIS:)': 36, 'SEMICOLON:;': 35},
+ 'parameters-opt': {None: 33,
+                    'COLON::': 33,
+                    'LPARENTHESIS:(': 32,
+                    'SEMICOLON:;': 33},
+ 'relation-opt': {None: 82,
+                  'COMMA:,': 82,
+                  'KEYWORD:ke': 82,
+                  'KEYWORD:lakukan': 82,
+                  'KEYWORD:maka': 82,
+                  'KEYWORD:selain_itu': 82,
+                  'KEYWORD:selesai': 82,
+                  'KEYWORD:turun_ke': 82,
+                  'RANGE_OPERATOR:..': 82,
+                  'RBRACKET:]': 82,
+                  'RELATIONAL_OPERATOR': 81,
+                  'RPARENTHESIS:)': 82,
+                  'SEMICOLON:;': 82},
+ 'sign-opt': {None: 86,
+              'ARITHMETIC_OPERATOR:+': 84,
+              'ARITHMETIC_OPERATOR:-': 85,
+              'CHAR_LITERAL': 86,
+              'IDENTIFIER': 86,
+              'KEYWORD:false': 86,
+              'KEYWORD:true': 86,
+              'LOGICAL_OPERATOR:tidak': 86,
+              'LPARENTHESIS:(': 86,
+              'NUMBER': 86,
+              'STRING_LITERAL': 86},
+ 'source': {'KEYWORD:program': 0, 'KEYWORD:unit': 1},
+ 'statement': {'IDENTIFIER': {'ASSIGN_OPERATOR::=': 60,
+                              'LBRACKET:[': 60,
+                              'LPARENTHESIS:(': 61},
+               'KEYWORD:jika': 57,
+               'KEYWORD:mulai': 56,
+               'KEYWORD:selama': 58,
+               'KEYWORD:untuk': 59,
+               'SEMICOLON:;': 62},
+ 'statement-after': {None: 55,
+                     'IDENTIFIER': 54,
+                     'KEYWORD:jika': 54,
+                     'KEYWORD:mulai': 54,
+                     'KEYWORD:selama': 54,
+                     'KEYWORD:selesai': 55,
+                     'KEYWORD:untuk': 54,
+                     'SEMICOLON:;': 54},
+ 'statements': {None: 53, 'KEYWORD:selesai': 53, 'SEMICOLON:;': 52},
+ 'subprogram': {'KEYWORD:fungsi': 29, 'KEYWORD:prosedur': 28},
+ 'subprograms': {None: 27,
+                 'KEYWORD:fungsi': 26,
+                 'KEYWORD:konstanta': 27,
+                 'KEYWORD:mulai': 27,
+                 'KEYWORD:prosedur': 26,
+                 'KEYWORD:selesai': 27,
+                 'KEYWORD:tipe': 27,
+                 'KEYWORD:variabel': 27},
+ 'subrange-opt': {None: 48,
+                  'RANGE_OPERATOR:..': 47,
+                  'RPARENTHESIS:)': 48,
+                  'SEMICOLON:;': 48},
+ 'type-items': {None: 24,
+                'IDENTIFIER': 23,
+                'KEYWORD:fungsi': 24,
+                'KEYWORD:konstanta': 24,
+                'KEYWORD:mulai': 24,
+                'KEYWORD:prosedur': 24,
+                'KEYWORD:selesai': 24,
+                'KEYWORD:tipe': 24,
+                'KEYWORD:variabel': 24},
+ 'uses-opt': {None: 7,
+              'KEYWORD:fungsi': 7,
+              'KEYWORD:gunakan': 6,
+              'KEYWORD:konstanta': 7,
+              'KEYWORD:mulai': 7,
+              'KEYWORD:prosedur': 7,
+              'KEYWORD:selesai': 7,
+              'KEYWORD:tipe': 7,
+              'KEYWORD:variabel': 7},
+ 'var-items': {None: 18,
+               'IDENTIFIER': 17,
+               'KEYWORD:fungsi': 18,
+               'KEYWORD:konstanta': 18,
+               'KEYWORD:mulai': 18,
+               'KEYWORD:prosedur': 18,
+               'KEYWORD:selesai': 18,
+               'KEYWORD:tipe': 18,
+               'KEYWORD:variabel': 18}}
@@ -1,12 +1,23 @@
 # src/parser.py
 
+from itertools import zip_longest
+
+# Event yang dikirim Parser ke handler, masing-masing berupa method handler:
+# - enter(name)     : masuk ke aturan produksi, misal '<program>'
+# - token(token)    : token terminal yang cocok
+# - exit(name)      : aturan produksi selesai
+# - subtree(node)   : node yang sudah jadi (LazyNode pada mode lazy)
+# Dalam bentuk deretan (event, value), event adalah nama method tersebut.
+ENTER, TOKEN, EXIT, SUBTREE = "enter", "token", "exit", "subtree"
+
 class Node:
     """
     Kelas untuk merepresentasikan sebuah node dalam Parse Tree.
     """
-    def __init__(self, name, value=None):
+    def __init__(self, name, value=None, token=None):
         self.name = name
         self.value = value
+        self.token = token  # token sumber, hanya untuk node daun
         self.children = []
 
     def add_child(self, node):
@@ -36,64 +47,415 @@ class Node:
             is_last_child = (i == child_count - 1)
             child.print_tree(new_prefix, is_last_child, is_root=False)
 
+class LazyNode(Node):
+    """
+    Placeholder untuk body subprogram (declaration-part / compound-statement)
+    yang baru diparsing saat children-nya pertama kali diakses.
+    """
+    def __init__(self, name, tokens, start, end, rule, lazy=True):
+        self.name = name
+        self.value = None
+        self.token = None
+        self.tokens = tokens
+        self.start = start
+        self.end = end
+        self.rule = rule
+        self.lazy = lazy
+        self._children = None
+
+    @property
+    def is_expanded(self):
+        return self._children is not None
+
+    @property
+    def children(self):
+        if self._children is None:
+            self.expand()
+        return self._children
+
+    @children.setter
+    def children(self, value):
+        self._children = value
+
+    def expand(self):
+        parser = Parser(self.tokens, self.start, self.end, lazy=self.lazy)
+        self._children = parser.parse_rule(self.rule).children
+        return self
+
+class TreeBuilder:
+    """
+    Handler event parser yang membangun Parse Tree (Node). Parser.parse dan
+    reader parse tree di serializer.py sama-sama membangun tree lewat kelas ini.
+    """
+    def __init__(self):
+        self.holder = Node(None)
+        self.children = self.holder.children  # children node yang sedang terbuka
+        self.stack = []
+
+    @property
+    def root(self):
+        children = self.holder.children
+        return children[0] if children else None
+
+    def enter(self, name):
+        node = Node(name)
+        self.children.append(node)
+        self.stack.append(self.children)
+        self.children = node.children
+
+    def token(self, token):
+        self.children.append(Node(f"{token.type}({token.value})", token=token))
+
+    def exit(self, name):
+        self.children = self.stack.pop()
+
+    def subtree(self, node):
+        self.children.append(node)
+
+class EventList(list):
+    """
+    Handler yang hanya menampung event sebagai (event, value).
+    """
+    def enter(self, name):
+        self.append((ENTER, name))
+
+    def token(self, token):
+        self.append((TOKEN, token))
+
+    def exit(self, name):
+        self.append((EXIT, name))
+
+    def subtree(self, node):
+        self.append((SUBTREE, node))
+
+def feed(events, handler):
+    """
+    Mengirim deretan (event, value) ke method handler yang bersesuaian.
+    """
+    for event, value in events:
+        getattr(handler, event)(value)
+
+def tree_events(root):
+    """
+    Mengubah tree yang sudah jadi menjadi deretan (event, value) yang sama dengan
+    yang dikirim Parser.parse_events, sehingga consumer event bisa dipakai untuk keduanya.
+    """
+    stack = [(ENTER, root)]
+    while stack:
+        event, item = stack.pop()
+        if event == EXIT:
+            yield EXIT, item
+        elif item.token is not None:
+            yield TOKEN, item.token
+        else:
+            yield ENTER, item.name
+            stack.append((EXIT, item.name))
+            children = item.children
+            for i in range(len(children) - 1, -1, -1):
+                stack.append((ENTER, children[i]))
+
+def same_tree(a, b):
+    """
+    Membandingkan dua tree secara struktural (nama node produksi serta type dan
+    value token daun) tanpa rekursi, lewat deretan event tree_events.
+    """
+    missing = object()
+    for left, right in zip_longest(tree_events(a), tree_events(b), fillvalue=(None, missing)):
+        if left[0] != right[0]:
+            return False
+        if left[0] == TOKEN:
+            if (left[1].type, left[1].value) != (right[1].type, right[1].value):
+                return False
+        elif left[1] != right[1]:
+            return False
+    return True
+
+class TokenStream:
+    """
+    Membungkus iterable token (misal Lexer.scan_tokens) supaya bisa diindeks oleh
+    Parser tanpa menyimpan seluruh token. Parser hanya mengakses token saat ini dan
+    satu token sesudahnya, jadi token sebelum itu langsung dibuang.
+    """
+    def __init__(self, tokens):
+        # Di-import di sini supaya import parser tetap ringan untuk startup CLI
+        from collections import deque
+        self.tokens = iter(tokens)
+        self.window = deque()
+        self.base = 0  # index token pertama di window
+
+    def __getitem__(self, index):
+        while self.base < index - 1 and self.window:
+            self.window.popleft()
+            self.base += 1
+        if index < self.base:
+            raise IndexError(f"Token pada posisi {index} sudah dibuang dari stream")
+        while index >= self.base + len(self.window):
+            token = next(self.tokens, None)
+            if token is None:
+                return None
+            self.window.append(token)
+        return self.window[index - self.base]
+
+def _parse_range(tokens, rule, offset):
+    # Dijalankan di worker process: parsing eager satu rentang token. offset
+    # adalah posisi token pertama di program asal, supaya posisi error sama
+    # dengan parsing eager/lazy biasa
+    return Parser(tokens, offset=offset).parse_rule(rule)
+
+def expand_parallel(root, max_workers=None):
+    """
+    Mengekspansi seluruh LazyNode yang belum diparsing di bawah root secara paralel
+    menggunakan process pool. Body yang independen diparsing di worker terpisah.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, LazyNode) and not node.is_expanded:
+            pending.append(node)
+            continue
+        stack.extend(node.children)
+
+    if not pending:
+        return root
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_parse_range, node.tokens[node.start:node.end], node.rule, node.start)
+            for node in pending
+        ]
+        for node, future in zip(pending, futures):
+            node.children = future.result().children
+    return root
+
 class Parser:
     """
     Melakukan syntax analysis menggunakan metode Recursive Descent.
+    Setiap aturan produksi mengirim event enter/token/exit ke handler; parse()
+    memakai TreeBuilder sebagai handler, parse_events() menerima handler lain.
+    Jika lazy=True, body prosedur/fungsi tidak langsung diparsing melainkan
+    diganti LazyNode yang menyimpan rentang tokennya. offset ditambahkan ke
+    posisi token pada pesan error jika tokens hanya potongan dari program.
     """
-    def __init__(self, tokens):
+    def __init__(self, tokens, start=0, end=None, lazy=False, offset=0):
+        if lazy and isinstance(tokens, TokenStream):
+            raise ValueError("Lazy parsing membutuhkan list token, bukan TokenStream")
         self.tokens = tokens
-        self.token_index = 0
-        self.current_token = self.tokens[self.token_index] if self.tokens else None
+        if end is None and isinstance(tokens, TokenStream):
+            # Panjang stream belum diketahui, TokenStream mengembalikan None di akhir
+            self.advance = self.advance_stream
+        elif end is None:
+            end = len(tokens)
+        self.end = end
+        self.lazy = lazy
+        self.offset = offset
+        self.token_index = start
+        self.current_token = self.token_at(self.token_index)
+        self.handler = None
+        self._block_ends = None
+
+    def token_at(self, index):
+        end = self.end
+        return self.tokens[index] if end is None or index < end else None
 
     def advance(self):
         self.token_index += 1
-        if self.token_index < len(self.tokens):
+        if self.token_index < self.end:
             self.current_token = self.tokens[self.token_index]
         else:
             self.current_token = None
 
+    def advance_stream(self):
+        self.token_index += 1
+        self.current_token = self.tokens[self.token_index]
+
+    def jump(self, index):
+        self.token_index = index - 1
+        self.advance()
+
     def expect(self, token_type, value=None):
         token = self.current_token
         if token and token.type == token_type and (value is None or token.value.lower() == value.lower()):
             self.advance()
-            node_name = f"{token.type}({token.value})"
-            return Node(node_name)
+            self.token(token)
+            return token
         
         expected_val = f" dengan nilai '{value}'" if value else ""
         current_val = f"'{self.current_token.value}' ({self.current_token.type})" if self.current_token else "None"
         raise SyntaxError(
-            f"Error Sintaks: Diharapkan token {token_type}{expected_val}, tetapi ditemukan {current_val} pada posisi {self.token_index}."
+            f"Error Sintaks: Diharapkan token {token_type}{expected_val}, tetapi ditemukan {current_val} pada posisi {self.token_index + self.offset}."
         )
 
     def peek(self, token_type, value=None):
         return self.current_token and self.current_token.type == token_type and \
                (value is None or self.current_token.value.lower() == value.lower())
 
+    def set_handler(self, handler):
+        # Method handler disimpan langsung supaya setiap event hanya satu pemanggilan
+        self.handler = handler
+        self.enter = handler.enter
+        self.token = handler.token
+        self.exit = handler.exit
+        # subtree opsional: tanpa method ini, node jadi (LazyNode) dikirim ulang sebagai event
+        subtree = getattr(handler, "subtree", None)
+        if subtree is None:
+            subtree = lambda node: feed(tree_events(node), handler)
+        self.subtree = subtree
+
+    def capture(self, rule):
+        """
+        Menjalankan rule dengan event ditampung ke EventList, bukan dikirim ke handler.
+        """
+        handler = self.handler
+        events = EventList()
+        self.set_handler(events)
+        try:
+            rule()
+        finally:
+            self.set_handler(handler)
+        return events
+
+    def replay(self, events):
+        feed(events, self.handler)
+
     def parse(self):
+        builder = TreeBuilder()
+        self.parse_events(builder)
+        return builder.root
+
+    def parse_events(self, handler):
+        """
+        Memparsing program/unit dan mengirim event ke handler (method enter, token,
+        exit, subtree) tanpa membangun Node. Memori yang dipakai sebanding dengan
+        kedalaman nesting.
+        """
         if not self.current_token:
-            return None
-        return self.program()
+            return
+        self.set_handler(handler)
+        if self.peek("KEYWORD", "unit"):
+            self.unit()
+        else:
+            self.program()
+
+    def parse_rule(self, rule):
+        """
+        Memparsing satu aturan produksi (nama method) dan memastikan seluruh
+        token dalam rentang parser habis terpakai.
+        """
+        builder = TreeBuilder()
+        self.set_handler(builder)
+        getattr(self, rule)()
+        if self.current_token:
+            raise SyntaxError(
+                f"Error Sintaks: Token berlebih '{self.current_token.value}' pada posisi {self.token_index + self.offset}."
+            )
+        return builder.root
+
+    # --- LAZY BODY SUBPROGRAM ---
+
+    def is_keyword(self, index, value):
+        token = self.tokens[index]
+        return token.type == "KEYWORD" and token.value.lower() == value
+
+    def match_blocks(self):
+        """
+        Satu kali scan linear untuk mencocokkan setiap 'mulai' dengan 'selesai' pasangannya.
+        """
+        if self._block_ends is None:
+            self._block_ends = {}
+            stack = []
+            for i in range(self.token_index, self.end):
+                if self.is_keyword(i, "mulai"):
+                    stack.append(i)
+                elif self.is_keyword(i, "selesai") and stack:
+                    self._block_ends[stack.pop()] = i
+        return self._block_ends
+
+    def body_range(self, start):
+        """
+        Mencari rentang body subprogram yang dimulai pada start.
+        Mengembalikan (index 'mulai' body, index 'selesai' body) atau None jika
+        tidak ditemukan (biar parsing eager yang melaporkan error-nya).
+        """
+        block_ends = self.match_blocks()
+        pending = 0  # jumlah subprogram bersarang yang body-nya belum dilewati
+        i = start
+        while i < self.end:
+            if self.is_keyword(i, "prosedur") or self.is_keyword(i, "fungsi"):
+                pending += 1
+            elif self.is_keyword(i, "mulai"):
+                close = block_ends.get(i)
+                if close is None:
+                    return None
+                if pending == 0:
+                    return i, close
+                pending -= 1
+                i = close + 1
+                continue
+            i += 1
+        return None
+
+    def subprogram_body(self):
+        # declaration-part dan compound-statement milik prosedur/fungsi
+        body = self.body_range(self.token_index) if self.lazy else None
+        if body is None:
+            self.declaration_part()
+            self.compound_statement()
+            return
+
+        begin, close = body
+        self.subtree(LazyNode("<declaration-part>", self.tokens, self.token_index, begin, "declaration_part"))
+        self.subtree(LazyNode("<compound-statement>", self.tokens, begin, close + 1, "compound_statement"))
+        self.jump(close + 1)
 
     # --- ATURAN PRODUKSI UTAMA ---
 
     def program(self):
-        node = Node("<program>")
-        node.add_child(self.program_header())
-        node.add_child(self.declaration_part())
-        node.add_child(self.compound_statement())
-        node.add_child(self.expect("DOT", "."))
+        self.enter("<program>")
+        self.program_header()
+        if self.peek("KEYWORD", "gunakan"):
+            self.uses_clause()
+        self.declaration_part()
+        self.compound_statement()
+        self.expect("DOT", ".")
         print("Parsing Selesai!")
-        return node
+        self.exit("<program>")
 
     def program_header(self):
-        node = Node("<program-header>")
-        node.add_child(self.expect("KEYWORD", "program")) 
-        node.add_child(self.expect("IDENTIFIER"))
-        node.add_child(self.expect("SEMICOLON", ";"))
-        return node
+        self.enter("<program-header>")
+        self.expect("KEYWORD", "program")
+        self.expect("IDENTIFIER")
+        self.expect("SEMICOLON", ";")
+        self.exit("<program-header>")
+
+    def unit(self):
+        self.enter("<unit>")
+        self.unit_header()
+        if self.peek("KEYWORD", "gunakan"):
+            self.uses_clause()
+        self.declaration_part()
+        self.expect("KEYWORD", "selesai")
+        self.expect("DOT", ".")
+        self.exit("<unit>")
+
+    def unit_header(self):
+        self.enter("<unit-header>")
+        self.expect("KEYWORD", "unit")
+        self.expect("IDENTIFIER")
+        self.expect("SEMICOLON", ";")
+        self.exit("<unit-header>")
+
+    def uses_clause(self):
+        self.enter("<uses-clause>")
+        self.expect("KEYWORD", "gunakan")
+        self.identifier_list()
+        self.expect("SEMICOLON", ";")
+        self.exit("<uses-clause>")
 
     def declaration_part(self):
-        node = Node("<declaration-part>")
+        self.enter("<declaration-part>")
         while self.peek("KEYWORD", "variabel") or \
               self.peek("KEYWORD", "konstanta") or \
               self.peek("KEYWORD", "tipe") or \
@@ -101,167 +463,167 @@ class Parser:
               self.peek("KEYWORD", "fungsi"):
             
             if self.peek("KEYWORD", "variabel"):
-                node.add_child(self.var_declaration())
+                self.var_declaration()
             if self.peek("KEYWORD", "konstanta"):
-                node.add_child(self.const_declaration())
+                self.const_declaration()
             if self.peek("KEYWORD", "tipe"):
-                node.add_child(self.type_declaration())
+                self.type_declaration()
             if self.peek("KEYWORD", "prosedur") or self.peek("KEYWORD", "fungsi"):
-                node.add_child(self.subprogram_declaration())
-        return node
+                self.subprogram_declaration()
+        self.exit("<declaration-part>")
 
     def compound_statement(self):
-        node = Node("<compound-statement>")
-        node.add_child(self.expect("KEYWORD", "mulai"))
-        node.add_child(self.statement_list())
-        node.add_child(self.expect("KEYWORD", "selesai"))
-        return node
+        self.enter("<compound-statement>")
+        self.expect("KEYWORD", "mulai")
+        self.statement_list()
+        self.expect("KEYWORD", "selesai")
+        self.exit("<compound-statement>")
 
     # --- ATURAN PRODUKSI DEKLARASI ---
 
     def var_declaration(self):
-        node = Node("<var-declaration>")
-        node.add_child(self.expect("KEYWORD", "variabel"))
+        self.enter("<var-declaration>")
+        self.expect("KEYWORD", "variabel")
         while self.peek("IDENTIFIER"):
-            node.add_child(self.identifier_list())
-            node.add_child(self.expect("COLON", ":"))
-            node.add_child(self.type_spec())
-            node.add_child(self.expect("SEMICOLON", ";"))
-        return node
+            self.identifier_list()
+            self.expect("COLON", ":")
+            self.type_spec()
+            self.expect("SEMICOLON", ";")
+        self.exit("<var-declaration>")
     
     def const_declaration(self):
-        node = Node("<const-declaration>")
-        node.add_child(self.expect("KEYWORD", "konstanta"))
+        self.enter("<const-declaration>")
+        self.expect("KEYWORD", "konstanta")
         while self.peek("IDENTIFIER"):
-            node.add_child(self.expect("IDENTIFIER"))
-            node.add_child(self.expect("RELATIONAL_OPERATOR", "="))
-            node.add_child(self.expect("NUMBER"))
-            node.add_child(self.expect("SEMICOLON", ";"))
-        return node
+            self.expect("IDENTIFIER")
+            self.expect("RELATIONAL_OPERATOR", "=")
+            self.expect("NUMBER")
+            self.expect("SEMICOLON", ";")
+        self.exit("<const-declaration>")
     
     def type_declaration(self):
-        node = Node("<type-declaration>")
-        node.add_child(self.expect("KEYWORD", "tipe"))
+        self.enter("<type-declaration>")
+        self.expect("KEYWORD", "tipe")
         while self.peek("IDENTIFIER"):
-            node.add_child(self.expect("IDENTIFIER"))
-            node.add_child(self.expect("RELATIONAL_OPERATOR", "="))
-            node.add_child(self.type_spec())
-            node.add_child(self.expect("SEMICOLON", ";"))
-        return node
+            self.expect("IDENTIFIER")
+            self.expect("RELATIONAL_OPERATOR", "=")
+            self.type_spec()
+            self.expect("SEMICOLON", ";")
+        self.exit("<type-declaration>")
     
     def subprogram_declaration(self):
-        node = Node("<subprogram-declaration>")
+        self.enter("<subprogram-declaration>")
         while self.peek("KEYWORD", "prosedur") or self.peek("KEYWORD", "fungsi"):
             if self.peek("KEYWORD", "prosedur"):
-                node.add_child(self.procedure_declaration())
+                self.procedure_declaration()
             elif self.peek("KEYWORD", "fungsi"):
-                node.add_child(self.function_declaration())
-        return node
+                self.function_declaration()
+        self.exit("<subprogram-declaration>")
     
     def procedure_declaration(self):
-        node = Node("<procedure-declaration>")
-        node.add_child(self.expect("KEYWORD", "prosedur"))
-        node.add_child(self.expect("IDENTIFIER"))
+        self.enter("<procedure-declaration>")
+        self.expect("KEYWORD", "prosedur")
+        self.expect("IDENTIFIER")
         
         if self.peek("LPARENTHESIS", "("):
-            node.add_child(self.formal_parameter_list())
+            self.formal_parameter_list()
         
-        node.add_child(self.expect("SEMICOLON", ";"))
-        node.add_child(self.declaration_part())
-        node.add_child(self.compound_statement())
-        node.add_child(self.expect("SEMICOLON", ";"))
-        return node
+        self.expect("SEMICOLON", ";")
+        self.subprogram_body()
+        self.expect("SEMICOLON", ";")
+        self.exit("<procedure-declaration>")
     
     def function_declaration(self):
-        node = Node("<function-declaration>")
-        node.add_child(self.expect("KEYWORD", "fungsi"))
-        node.add_child(self.expect("IDENTIFIER"))
+        self.enter("<function-declaration>")
+        self.expect("KEYWORD", "fungsi")
+        self.expect("IDENTIFIER")
         
         if self.peek("LPARENTHESIS", "("):
-            node.add_child(self.formal_parameter_list())
+            self.formal_parameter_list()
         
-        node.add_child(self.expect("COLON", ":"))
-        node.add_child(self.type_spec())
-        node.add_child(self.expect("SEMICOLON", ";"))
-        node.add_child(self.declaration_part())
-        node.add_child(self.compound_statement())
-        node.add_child(self.expect("SEMICOLON", ";"))
-        return node
+        self.expect("COLON", ":")
+        self.type_spec()
+        self.expect("SEMICOLON", ";")
+        self.subprogram_body()
+        self.expect("SEMICOLON", ";")
+        self.exit("<function-declaration>")
 
     def formal_parameter_list(self):
-        node = Node("<formal-parameter-list>")
-        node.add_child(self.expect("LPARENTHESIS", "("))
-        node.add_child(self.parameter_group())
+        self.enter("<formal-parameter-list>")
+        self.expect("LPARENTHESIS", "(")
+        self.parameter_group()
         while self.peek("SEMICOLON", ";"):
-            node.add_child(self.expect("SEMICOLON", ";"))
-            node.add_child(self.parameter_group())
-        node.add_child(self.expect("RPARENTHESIS", ")"))
-        return node
+            self.expect("SEMICOLON", ";")
+            self.parameter_group()
+        self.expect("RPARENTHESIS", ")")
+        self.exit("<formal-parameter-list>")
     
     def parameter_group(self):
-        node = Node("<parameter-group>")
-        node.add_child(self.identifier_list())
-        node.add_child(self.expect("COLON", ":"))
-        node.add_child(self.type_spec())
-        return node
+        self.enter("<parameter-group>")
+        self.identifier_list()
+        self.expect("COLON", ":")
+        self.type_spec()
+        self.exit("<parameter-group>")
 
     def identifier_list(self):
-        node = Node("<identifier-list>")
-        node.add_child(self.expect("IDENTIFIER"))
+        self.enter("<identifier-list>")
+        self.expect("IDENTIFIER")
         while self.peek("COMMA"):
-            node.add_child(self.expect("COMMA", ","))
-            node.add_child(self.expect("IDENTIFIER"))
-        return node
+            self.expect("COMMA", ",")
+            self.expect("IDENTIFIER")
+        self.exit("<identifier-list>")
 
     def type_spec(self):
-        node = Node("<type>")
+        self.enter("<type>")
         if self.peek("KEYWORD", "integer"):
-            node.add_child(self.expect("KEYWORD", "integer"))
+            self.expect("KEYWORD", "integer")
         elif self.peek("KEYWORD", "real"):
-            node.add_child(self.expect("KEYWORD", "real"))
+            self.expect("KEYWORD", "real")
         elif self.peek("KEYWORD", "boolean"):
-            node.add_child(self.expect("KEYWORD", "boolean"))
+            self.expect("KEYWORD", "boolean")
         elif self.peek("KEYWORD", "char"):
-            node.add_child(self.expect("KEYWORD", "char"))
+            self.expect("KEYWORD", "char")
         elif self.peek("KEYWORD", "larik"):
-            node.add_child(self.expect("KEYWORD", "larik"))
-            node.add_child(self.expect("LBRACKET", "["))
-            node.add_child(self.range_spec())
-            node.add_child(self.expect("RBRACKET", "]"))
-            node.add_child(self.expect("KEYWORD", "dari"))
-            node.add_child(self.type_spec())
+            self.expect("KEYWORD", "larik")
+            self.expect("LBRACKET", "[")
+            self.range_spec()
+            self.expect("RBRACKET", "]")
+            self.expect("KEYWORD", "dari")
+            self.type_spec()
         else:
-            expr_node = self.expression() 
+            # Event expression pertama ditahan dulu, karena baru setelahnya
+            # diketahui apakah ia harus dibungkus <subrange-type>
+            expr_events = self.capture(self.expression)
             
             if self.peek("RANGE_OPERATOR", ".."):
-                subrange_node = Node("<subrange-type>")
-                subrange_node.add_child(expr_node)
-                subrange_node.add_child(self.expect("RANGE_OPERATOR", "..")) 
-                subrange_node.add_child(self.expression()) # Ambil expression kedua
-                node.add_child(subrange_node)
+                self.enter("<subrange-type>")
+                self.replay(expr_events)
+                self.expect("RANGE_OPERATOR", "..")
+                self.expression() # Ambil expression kedua
+                self.exit("<subrange-type>")
             else:
-                node.add_child(expr_node) 
-        return node
+                self.replay(expr_events)
+        self.exit("<type>")
     
     def range_spec(self):
-        node = Node("<range>")
-        node.add_child(self.expression())
-        node.add_child(self.expect("RANGE_OPERATOR", ".."))
-        node.add_child(self.expression())
-        return node
+        self.enter("<range>")
+        self.expression()
+        self.expect("RANGE_OPERATOR", "..")
+        self.expression()
+        self.exit("<range>")
 
     # --- ATURAN PRODUKSI STATEMENT ---
 
     def statement_list(self):
-        node = Node("<statement-list>")
-        node.add_child(self.statement())
+        self.enter("<statement-list>")
+        self.statement()
         while self.peek("SEMICOLON"):
-            node.add_child(self.expect("SEMICOLON", ";"))
+            self.expect("SEMICOLON", ";")
             if not self.peek("KEYWORD", "selesai"):
-                 node.add_child(self.statement())
+                 self.statement()
             else:
                 break
-        return node
+        self.exit("<statement-list>")
 
     def statement(self):
             # 1. Cek Compound Statement (Blok mulai ... selesai)
@@ -285,8 +647,9 @@ class Parser:
                 next_token_idx = self.token_index + 1
                 
                 is_assignment = False
-                if next_token_idx < len(self.tokens):
-                    next_type = self.tokens[next_token_idx].type
+                next_token = self.token_at(next_token_idx)
+                if next_token:
+                    next_type = next_token.type
                     # Assignment ditandai dengan ':=' ATAU '[' (untuk array)
                     if next_type == "ASSIGN_OPERATOR" or next_type == "LBRACKET":
                         is_assignment = True
@@ -298,31 +661,32 @@ class Parser:
                     
             # 6. Handle Empty Statement (titik koma berlebih)
             elif self.peek("SEMICOLON"):
-                return Node("<empty-statement>")
+                self.enter("<empty-statement>")
+                self.exit("<empty-statement>")
                 
             else:
                 raise SyntaxError(f"Error Sintaks: Diharapkan statement, ditemukan '{self.current_token.value}'")
 
     def assignment_statement(self):
         # Grammar: ID [ '[' expression ']' ] := expression
-        node = Node("<assignment-statement>")
+        self.enter("<assignment-statement>")
         
         # 1. Nama Variabel
-        node.add_child(self.expect("IDENTIFIER"))
+        self.expect("IDENTIFIER")
         
         # 2. Cek apakah ini akses Array? (Opsional)
         if self.peek("LBRACKET", "["):
-             node.add_child(self.expect("LBRACKET", "["))
-             node.add_child(self.expression()) # Indeks
-             node.add_child(self.expect("RBRACKET", "]"))
+             self.expect("LBRACKET", "[")
+             self.expression() # Indeks
+             self.expect("RBRACKET", "]")
         
         # 3. Operator Assignment
-        node.add_child(self.expect("ASSIGN_OPERATOR", ":="))
+        self.expect("ASSIGN_OPERATOR", ":=")
         
         # 4. Nilai Baru
-        node.add_child(self.expression())
+        self.expression()
         
-        return node
+        self.exit("<assignment-statement>")
 
     # ATURAN PRODUKSI EKSPRESI
 
@@ -331,209 +695,209 @@ class Parser:
         Aturan produksi: <expression> -> <simple-expression> [ <relational-operator> <simple-expression> ]
         Saat ini hanya mengimplementasikan bagian pertama.
         """
-        node = Node("<expression>")
-        node.add_child(self.simple_expression())
+        self.enter("<expression>")
+        self.simple_expression()
         # Cek Operator Relasional
         if self.current_token and self.current_token.type == "RELATIONAL_OPERATOR":
-            node.add_child(self.expect("RELATIONAL_OPERATOR"))
-            node.add_child(self.simple_expression())
+            self.expect("RELATIONAL_OPERATOR")
+            self.simple_expression()
 
-        return node
+        self.exit("<expression>")
 
     def simple_expression(self):
         """
         Aturan produksi: <simple-expression> -> <term> ( <additive-operator> <term> )*
         """
-        node = Node("<simple-expression>")
+        self.enter("<simple-expression>")
 
         # Handle unary operator (+/-) di depan angka (misal: -5)
         if self.peek("ARITHMETIC_OPERATOR", "+") or self.peek("ARITHMETIC_OPERATOR", "-"):
-             node.add_child(self.expect("ARITHMETIC_OPERATOR"))
+             self.expect("ARITHMETIC_OPERATOR")
 
-        node.add_child(self.term()) # Selalu dimulai dengan term
+        self.term() # Selalu dimulai dengan term
 
         # Loop jika ada operator tambah/kurang
         while self.current_token and self.current_token.value in ['+', '-', 'atau']:
             op_token = self.current_token
             if op_token.value == '+':
-                node.add_child(self.expect("ARITHMETIC_OPERATOR", "+"))
-                node.add_child(self.term())
+                self.expect("ARITHMETIC_OPERATOR", "+")
+                self.term()
             elif op_token.value == '-':
-                 node.add_child(self.expect("ARITHMETIC_OPERATOR", "-"))
-                 node.add_child(self.term())
+                 self.expect("ARITHMETIC_OPERATOR", "-")
+                 self.term()
             elif op_token.value.lower() == 'atau':
-                 node.add_child(self.expect("LOGICAL_OPERATOR", "atau"))
-                 node.add_child(self.term())
+                 self.expect("LOGICAL_OPERATOR", "atau")
+                 self.term()
         
-        return node
+        self.exit("<simple-expression>")
 
     def term(self):
         """
         Aturan produksi: <term> -> <factor> ( <multiplicative-operator> <factor> )*
         """
-        node = Node("<term>")
-        node.add_child(self.factor()) # Selalu dimulai dengan factor
+        self.enter("<term>")
+        self.factor() # Selalu dimulai dengan factor
 
         # Loop jika ada operator kali/bagi
         while self.current_token and self.current_token.value in ['*', '/', 'bagi', 'mod', 'dan']:
             if self.peek("ARITHMETIC_OPERATOR", "*"):
-                node.add_child(self.expect("ARITHMETIC_OPERATOR", "*"))
-                node.add_child(self.factor())
+                self.expect("ARITHMETIC_OPERATOR", "*")
+                self.factor()
             elif self.peek("ARITHMETIC_OPERATOR", "/"):
-                node.add_child(self.expect("ARITHMETIC_OPERATOR", "/"))
-                node.add_child(self.factor())
+                self.expect("ARITHMETIC_OPERATOR", "/")
+                self.factor()
             elif self.peek("ARITHMETIC_OPERATOR", "bagi"): # div
-                node.add_child(self.expect("ARITHMETIC_OPERATOR", "bagi"))
-                node.add_child(self.factor())
+                self.expect("ARITHMETIC_OPERATOR", "bagi")
+                self.factor()
             elif self.peek("ARITHMETIC_OPERATOR", "mod"): # mod
-                node.add_child(self.expect("ARITHMETIC_OPERATOR", "mod"))
-                node.add_child(self.factor())
+                self.expect("ARITHMETIC_OPERATOR", "mod")
+                self.factor()
             elif self.peek("LOGICAL_OPERATOR", "dan"): # and
-                node.add_child(self.expect("LOGICAL_OPERATOR", "dan"))
-                node.add_child(self.factor())
+                self.expect("LOGICAL_OPERATOR", "dan")
+                self.factor()
             else:
                 break
         
-        return node
+        self.exit("<term>")
 
     def factor(self):
         """
         Aturan produksi: <factor> -> IDENTIFIER | NUMBER | STRING | CHAR | ( <expression> ) | true | false
         """
-        node = Node("<factor>")
+        self.enter("<factor>")
         
         if self.peek("IDENTIFIER"):
             # Cek apakah ini Function Call (ID diikuti kurung buka)
-            next_token_idx = self.token_index + 1
+            next_token = self.token_at(self.token_index + 1)
             
             # Kasus 1: Function Call -> nama_fungsi(...)
-            if next_token_idx < len(self.tokens) and self.tokens[next_token_idx].type == "LPARENTHESIS":
-                 node.add_child(self.function_call())
+            if next_token and next_token.type == "LPARENTHESIS":
+                 self.function_call()
 
             # Kasus 2: Array Access -> nama_array[indeks] 
-            elif next_token_idx < len(self.tokens) and self.tokens[next_token_idx].type == "LBRACKET":
-                 node.add_child(self.expect("IDENTIFIER"))
-                 node.add_child(self.expect("LBRACKET", "["))
-                 node.add_child(self.expression()) # Indeks array
-                 node.add_child(self.expect("RBRACKET", "]"))
+            elif next_token and next_token.type == "LBRACKET":
+                 self.expect("IDENTIFIER")
+                 self.expect("LBRACKET", "[")
+                 self.expression() # Indeks array
+                 self.expect("RBRACKET", "]")
 
             # Kasus 3: Variabel Biasa
             else:
-                 node.add_child(self.expect("IDENTIFIER"))
+                 self.expect("IDENTIFIER")
                  
         elif self.peek("NUMBER"):
-            node.add_child(self.expect("NUMBER"))
+            self.expect("NUMBER")
             
         elif self.peek("STRING_LITERAL"):
-            node.add_child(self.expect("STRING_LITERAL"))
+            self.expect("STRING_LITERAL")
             
         elif self.peek("CHAR_LITERAL"):
-            node.add_child(self.expect("CHAR_LITERAL"))
+            self.expect("CHAR_LITERAL")
 
         elif self.peek("KEYWORD", "true"):
-            node.add_child(self.expect("KEYWORD", "true"))
+            self.expect("KEYWORD", "true")
             
         elif self.peek("KEYWORD", "false"):
-            node.add_child(self.expect("KEYWORD", "false"))
+            self.expect("KEYWORD", "false")
             
         elif self.peek("LOGICAL_OPERATOR", "tidak"): # Operator NOT
-            node.add_child(self.expect("LOGICAL_OPERATOR", "tidak"))
-            node.add_child(self.factor())
+            self.expect("LOGICAL_OPERATOR", "tidak")
+            self.factor()
             
         elif self.peek("LPARENTHESIS", "("):
-            node.add_child(self.expect("LPARENTHESIS", "("))
-            node.add_child(self.expression())
-            node.add_child(self.expect("RPARENTHESIS", ")"))
+            self.expect("LPARENTHESIS", "(")
+            self.expression()
+            self.expect("RPARENTHESIS", ")")
             
         else:
             val = self.current_token.value if self.current_token else "EOF"
             raise SyntaxError(f"Error Sintaks: Diharapkan factor, ditemukan '{val}'")
         
-        return node
+        self.exit("<factor>")
     
     # Control Flow Statements
     def if_statement(self):
         # Grammar: jika <expression> maka <statement> [selain_itu <statement>]
-        node = Node("<if-statement>")
-        node.add_child(self.expect("KEYWORD", "jika"))
-        node.add_child(self.expression())
-        node.add_child(self.expect("KEYWORD", "maka"))
-        node.add_child(self.statement())
+        self.enter("<if-statement>")
+        self.expect("KEYWORD", "jika")
+        self.expression()
+        self.expect("KEYWORD", "maka")
+        self.statement()
         
         # Cek apakah ada 'selain_itu' (else)
         if self.peek("KEYWORD", "selain_itu"):
-            node.add_child(self.expect("KEYWORD", "selain_itu"))
-            node.add_child(self.statement())
+            self.expect("KEYWORD", "selain_itu")
+            self.statement()
             
-        return node
+        self.exit("<if-statement>")
 
     def while_statement(self):
         # Grammar: selama <expression> lakukan <statement>
-        node = Node("<while-statement>")
-        node.add_child(self.expect("KEYWORD", "selama"))
-        node.add_child(self.expression())
-        node.add_child(self.expect("KEYWORD", "lakukan"))
-        node.add_child(self.statement())
-        return node
+        self.enter("<while-statement>")
+        self.expect("KEYWORD", "selama")
+        self.expression()
+        self.expect("KEYWORD", "lakukan")
+        self.statement()
+        self.exit("<while-statement>")
 
     def for_statement(self):
         # Grammar: untuk <id> := <expr> ke/turun_ke <expr> lakukan <statement>
-        node = Node("<for-statement>")
-        node.add_child(self.expect("KEYWORD", "untuk"))
-        node.add_child(self.expect("IDENTIFIER"))
-        node.add_child(self.expect("ASSIGN_OPERATOR", ":="))
-        node.add_child(self.expression())
+        self.enter("<for-statement>")
+        self.expect("KEYWORD", "untuk")
+        self.expect("IDENTIFIER")
+        self.expect("ASSIGN_OPERATOR", ":=")
+        self.expression()
         
         # Cek arah loop
         if self.peek("KEYWORD", "ke"):
-            node.add_child(self.expect("KEYWORD", "ke"))
+            self.expect("KEYWORD", "ke")
         elif self.peek("KEYWORD", "turun_ke"):
-            node.add_child(self.expect("KEYWORD", "turun_ke"))
+            self.expect("KEYWORD", "turun_ke")
         else:
             raise SyntaxError("Error Sintaks: Diharapkan 'ke' atau 'turun_ke' dalam loop 'untuk'.")
             
-        node.add_child(self.expression())
-        node.add_child(self.expect("KEYWORD", "lakukan"))
-        node.add_child(self.statement())
-        return node
+        self.expression()
+        self.expect("KEYWORD", "lakukan")
+        self.statement()
+        self.exit("<for-statement>")
     
     # Procedure Call
     def procedure_call(self):
         # Grammar: IDENTIFIER ( [ <parameter-list> ] )
-        node = Node("<procedure-call>")
-        node.add_child(self.expect("IDENTIFIER"))
-        node.add_child(self.expect("LPARENTHESIS", "("))
+        self.enter("<procedure-call>")
+        self.expect("IDENTIFIER")
+        self.expect("LPARENTHESIS", "(")
         
         if not self.peek("RPARENTHESIS", ")"):
-             node.add_child(self.parameter_list())
+             self.parameter_list()
 
-        node.add_child(self.expect("RPARENTHESIS", ")"))
+        self.expect("RPARENTHESIS", ")")
             
-        return node
+        self.exit("<procedure-call>")
 
     def parameter_list(self):
         # Grammar: <expression> (, <expression>)*
-        node = Node("<parameter-list>")
-        node.add_child(self.expression())
+        self.enter("<parameter-list>")
+        self.expression()
         
         while self.peek("COMMA", ","):
-            node.add_child(self.expect("COMMA", ","))
-            node.add_child(self.expression())
+            self.expect("COMMA", ",")
+            self.expression()
             
-        return node
+        self.exit("<parameter-list>")
     
     # Function Call
     def function_call(self):
         # Mirip procedure call tapi mengembalikan nilai (bagian dari factor)
-        node = Node("<function-call>")
-        node.add_child(self.expect("IDENTIFIER"))
-        node.add_child(self.expect("LPARENTHESIS", "("))
+        self.enter("<function-call>")
+        self.expect("IDENTIFIER")
+        self.expect("LPARENTHESIS", "(")
         
         # Parameter opsional untuk fungsi
         if not self.peek("RPARENTHESIS", ")"):
-             node.add_child(self.parameter_list())
+             self.parameter_list()
              
-        node.add_child(self.expect("RPARENTHESIS", ")"))
-        return node
+        self.expect("RPARENTHESIS", ")")
+        self.exit("<function-call>")
     
     
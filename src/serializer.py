@@ -0,0 +1,369 @@
+"""
+Format output yang bisa dibaca mesin untuk token dan parse tree.
+
+Format yang didukung:
+- text   : format lama, 'TYPE(value)' per baris dan tree box-drawing.
+- ndjson : satu objek JSON per baris.
+- binary : record length-prefixed (little-endian).
+
+Semua writer menulis secara bertahap dengan writelines per batch, dan setiap
+format ndjson/binary punya reader yang membangun ulang Token/Node tanpa lexing ulang.
+Writer parse tree menerima event parser, jadi bisa dipakai untuk tree yang sudah
+jadi maupun parsing streaming (stream_tree).
+"""
+import os
+import struct
+from itertools import islice
+from pascal_token import Token
+from parser import ENTER, TOKEN, EXIT, Parser, TokenStream, TreeBuilder, feed, tree_events
+
+FORMATS = ("text", "ndjson", "binary")
+
+EXTENSIONS = {"text": ".txt", "ndjson": ".ndjson", "binary": ".bin"}
+
+BATCH_SIZE = 4096
+
+TOKEN_MAGIC = b"PSTK\x02"
+TREE_MAGIC = b"PSTR\x04"
+
+# line, column, panjang type, panjang value
+TOKEN_HEADER = struct.Struct("<IIBI")
+# jenis record (NODE_RECORD/TOKEN_RECORD), depth
+TREE_RECORD = struct.Struct("<BI")
+# panjang name node produksi
+NAME_HEADER = struct.Struct("<I")
+
+NODE_RECORD, TOKEN_RECORD = 0, 1
+
+def format_from_path(path):
+    for fmt, ext in EXTENSIONS.items():
+        if path.endswith(ext):
+            return fmt
+    raise ValueError(f"Format file '{path}' tidak dikenali")
+
+def write_batched(f, records):
+    """
+    Menulis iterable records ke file dengan writelines per BATCH_SIZE record.
+    """
+    records = iter(records)
+    while True:
+        batch = list(islice(records, BATCH_SIZE))
+        if not batch:
+            break
+        f.writelines(batch)
+
+# --- TOKEN ---
+
+def token_fields(token):
+    return {"type": token.type, "value": token.value, "line": token.line, "column": token.column}
+
+def decode_token_binary(data, offset):
+    """
+    Membaca satu record token biner pada offset, mengembalikan (Token, offset berikutnya).
+    """
+    line, column, type_len, value_len = TOKEN_HEADER.unpack_from(data, offset)
+    offset += TOKEN_HEADER.size
+    token_type = data[offset:offset + type_len].decode("utf-8")
+    offset += type_len
+    value = data[offset:offset + value_len].decode("utf-8")
+    offset += value_len
+    return Token(token_type, value, line or None, column or None), offset
+
+def token_encoder(fmt):
+    """
+    Mengembalikan (header file, fungsi encode satu token) untuk format fmt.
+    """
+    if fmt == "binary":
+        pack = TOKEN_HEADER.pack
+        def encode(token):
+            token_type = token.type.encode("utf-8")
+            value = token.value.encode("utf-8")
+            return pack(token.line or 0, token.column or 0, len(token_type), len(value)) + token_type + value
+        return TOKEN_MAGIC, encode
+
+    if fmt == "ndjson":
+        import json
+        dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+        def encode(token):
+            return dumps(token_fields(token)) + "\n"
+        return "", encode
+
+    return "", lambda token: f"{token}\n"
+
+def open_output(path, fmt):
+    if fmt == "binary":
+        return open(path, 'wb')
+    return open(path, 'w', encoding='utf-8')
+
+def write_tokens(tokens, path, fmt="text"):
+    header, encode = token_encoder(fmt)
+    with open_output(path, fmt) as f:
+        f.write(header)
+        write_batched(f, map(encode, tokens))
+
+def tee_tokens(tokens, path, fmt="text"):
+    """
+    Generator yang meneruskan tokens apa adanya sambil menulisnya ke file token
+    per batch, supaya lexer, file token, dan parser berjalan dalam satu aliran
+    tanpa list token. File baru lengkap setelah generator habis dibaca.
+    """
+    header, encode = token_encoder(fmt)
+    with open_output(path, fmt) as f:
+        f.write(header)
+        batch = []
+        for token in tokens:
+            batch.append(encode(token))
+            if len(batch) >= BATCH_SIZE:
+                f.writelines(batch)
+                batch.clear()
+            yield token
+        f.writelines(batch)
+
+def read_tokens(path, fmt=None):
+    fmt = fmt or format_from_path(path)
+    if fmt == "ndjson":
+        import json
+        with open(path, 'r', encoding='utf-8') as f:
+            loads = json.loads
+            return [Token(**loads(line)) for line in f if line.strip()]
+
+    if fmt == "binary":
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(TOKEN_MAGIC):
+            raise ValueError(f"File '{path}' bukan file token biner")
+
+        tokens = []
+        offset = len(TOKEN_MAGIC)
+        while offset < len(data):
+            token, offset = decode_token_binary(data, offset)
+            tokens.append(token)
+        return tokens
+
+    raise ValueError(f"Reader token untuk format '{fmt}' tidak tersedia")
+
+# --- PARSE TREE ---
+#
+# Writer parse tree adalah handler event parser (lihat Parser.parse_events).
+# write_tree mengubah tree yang sudah jadi menjadi event dengan tree_events,
+# sedangkan stream_tree mengirim event parser langsung ke writer tanpa Node.
+# Record ndjson/binary ditulis dalam urutan pre-order beserta depth-nya, sehingga
+# writer cukup mengingat kedalaman saat ini. Node produksi disimpan sebagai name,
+# node daun sebagai token utuh (type, value, line, column).
+
+class TreeWriter:
+    """
+    Dasar writer parse tree: handler event parser yang menulis per batch.
+    """
+    def __init__(self, f, path=None):
+        self.f = f
+        self.path = path  # tujuan akhir jika f adalah file sementara
+        self.batch = []
+        self.depth = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is not None:
+            # Tree yang terpotong (misal karena SyntaxError) tidak boleh tersisa
+            # di disk, sama seperti jalur non-stream yang tidak menulis apa pun
+            self.f.close()
+            if self.path:
+                os.remove(self.f.name)
+            return
+        self.close()
+        if self.path:
+            os.replace(self.f.name, self.path)
+
+    def enter(self, name):
+        self.write_node(name)
+        self.depth += 1
+
+    def token(self, token):
+        self.write_token(token)
+
+    def exit(self, name):
+        self.depth -= 1
+
+    def subtree(self, node):
+        feed(tree_events(node), self)
+
+    def write_node(self, name):
+        raise NotImplementedError
+
+    def write_token(self, token):
+        raise NotImplementedError
+
+    def write(self, record):
+        self.batch.append(record)
+        if len(self.batch) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        self.f.writelines(self.batch)
+        self.batch.clear()
+
+    def close(self):
+        self.flush()
+        self.f.close()
+
+class TextTreeWriter(TreeWriter):
+    """
+    Tree box-drawing, sama persis dengan Node.print_tree. Konektor sebuah node baru
+    pasti setelah saudara berikutnya muncul atau induknya selesai, jadi subtree anak
+    root yang sedang berjalan ditahan sebagai (depth, name) dan ditulis saat anak
+    root berikutnya dimulai. Format ndjson dan binary tidak perlu menahan apa pun.
+    """
+    def __init__(self, f, path=None):
+        super().__init__(f, path)
+        self.pending = []
+
+    def write_node(self, name):
+        if self.depth == 0:
+            self.write(f"{name}\n")
+            return
+        if self.depth == 1:
+            self.write_pending(is_last=False)
+        self.pending.append((self.depth, name))
+
+    def write_token(self, token):
+        self.write_node(f"{token.type}({token.value})")
+
+    def write_pending(self, is_last):
+        pending = self.pending
+        if not pending:
+            return
+
+        # Scan mundur: sebuah node adalah anak terakhir jika belum ada saudara sesudahnya
+        last = [is_last] * len(pending)
+        has_next = []
+        for i in range(len(pending) - 1, 0, -1):
+            depth = pending[i][0]
+            del has_next[depth + 1:]
+            while len(has_next) <= depth:
+                has_next.append(False)
+            last[i] = not has_next[depth]
+            has_next[depth] = True
+
+        prefixes = []
+        for (depth, name), node_is_last in zip(pending, last):
+            del prefixes[depth - 1:]
+            connector = "└── " if node_is_last else "├── "
+            self.write(f"{''.join(prefixes)}{connector}{name}\n")
+            prefixes.append("    " if node_is_last else "│   ")
+        pending.clear()
+
+    def close(self):
+        self.write_pending(is_last=True)
+        super().close()
+
+class NdjsonTreeWriter(TreeWriter):
+    def __init__(self, f, path=None):
+        import json
+        super().__init__(f, path)
+        self.dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    def write_node(self, name):
+        self.write(self.dumps({"name": name, "depth": self.depth}) + "\n")
+
+    def write_token(self, token):
+        record = token_fields(token)
+        record["depth"] = self.depth
+        self.write(self.dumps(record) + "\n")
+
+class BinaryTreeWriter(TreeWriter):
+    def __init__(self, f, path=None):
+        super().__init__(f, path)
+        self.encode_token = token_encoder("binary")[1]
+        self.write(TREE_MAGIC)
+
+    def write_node(self, name):
+        name = name.encode("utf-8")
+        self.write(TREE_RECORD.pack(NODE_RECORD, self.depth) + NAME_HEADER.pack(len(name)) + name)
+
+    def write_token(self, token):
+        self.write(TREE_RECORD.pack(TOKEN_RECORD, self.depth) + self.encode_token(token))
+
+def open_tree_writer(path, fmt="text"):
+    """
+    Writer ditulis ke path + '.tmp' lalu di-rename ke path jika selesai tanpa error.
+    """
+    writer = {"binary": BinaryTreeWriter, "ndjson": NdjsonTreeWriter}.get(fmt, TextTreeWriter)
+    return writer(open_output(path + ".tmp", fmt), path)
+
+def write_tree(root, path, fmt="text"):
+    with open_tree_writer(path, fmt) as writer:
+        feed(tree_events(root), writer)
+
+def stream_tree(tokens, path, fmt="text"):
+    """
+    Memparsing tokens (list atau iterator, misal Lexer.scan_tokens) langsung ke file
+    parse tree tanpa membangun Node maupun menyimpan seluruh token.
+    """
+    with open_tree_writer(path, fmt) as writer:
+        Parser(TokenStream(tokens)).parse_events(writer)
+
+def record_events(records):
+    """
+    Mengubah record pre-order (depth, item) menjadi event parser. item adalah
+    nama node produksi atau Token untuk node daun.
+    """
+    names = []  # node yang masih terbuka
+    for depth, item in records:
+        while len(names) > depth:
+            yield EXIT, names.pop()
+        if isinstance(item, Token):
+            yield TOKEN, item
+        else:
+            yield ENTER, item
+            names.append(item)
+    while names:
+        yield EXIT, names.pop()
+
+def ndjson_tree_record(record):
+    if "name" in record:
+        return record["depth"], record["name"]
+    return record["depth"], Token(record["type"], record["value"], record["line"], record["column"])
+
+def build_tree(records):
+    """
+    Membangun ulang Node dari record pre-order (depth, item) lewat TreeBuilder.
+    """
+    builder = TreeBuilder()
+    feed(record_events(records), builder)
+    return builder.root
+
+def read_tree(path, fmt=None):
+    fmt = fmt or format_from_path(path)
+    if fmt == "ndjson":
+        import json
+        with open(path, 'r', encoding='utf-8') as f:
+            loads = json.loads
+            records = (loads(line) for line in f if line.strip())
+            return build_tree(ndjson_tree_record(r) for r in records)
+
+    if fmt == "binary":
+        with open(path, 'rb') as f:
+            data = f.read()
+        if not data.startswith(TREE_MAGIC):
+            raise ValueError(f"File '{path}' bukan file parse tree biner")
+        return build_tree(iter_tree_binary(data))
+
+    raise ValueError(f"Reader parse tree untuk format '{fmt}' tidak tersedia")
+
+def iter_tree_binary(data):
+    unpack = TREE_RECORD.unpack_from
+    size = TREE_RECORD.size
+    offset = len(TREE_MAGIC)
+    while offset < len(data):
+        kind, depth = unpack(data, offset)
+        offset += size
+        if kind == TOKEN_RECORD:
+            token, offset = decode_token_binary(data, offset)
+            yield depth, token
+            continue
+        (name_len,) = NAME_HEADER.unpack_from(data, offset)
+        offset += NAME_HEADER.size
+        yield depth, data[offset:offset + name_len].decode("utf-8")
+        offset += name_len
@@ -0,0 +1,184 @@
+"""
+Parser LL(1) table-driven untuk Pascal-S.
+
+Parser ini menjalankan tabel prediktif dari parse_table.py (hasil
+gen_parse_table.py dari pascal_s.grammar) dengan stack eksplisit, sehingga
+kedalaman nesting program tidak dibatasi recursion limit Python. Parse tree
+yang dihasilkan sama dengan Parser (recursive descent) di parser.py.
+"""
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+from parser import Node, Parser, feed, tree_events
+from parse_table import START, PRODUCTIONS, TABLE
+
+# Jenis simbol di stack
+TERMINAL, PREDICATE, NONTERMINAL, END_NODE, WRAP = range(5)
+
+EOF_KEYS = ("$", "$")
+
+def compile_symbol(symbol):
+    if symbol in TABLE:
+        return (NONTERMINAL, symbol, symbol.startswith("<"))
+    kind = PREDICATE if symbol.startswith("&") else TERMINAL
+    token_type, sep, value = symbol.lstrip("&").partition(":")
+    return (kind, token_type, value.lower() if sep else None)
+
+# Produksi dikompilasi sekali menjadi deretan instruksi stack (sudah dibalik)
+COMPILED_PRODUCTIONS = [
+    (lhs, [compile_symbol(s) for s in reversed(rhs)], wrap)
+    for lhs, rhs, wrap in PRODUCTIONS
+]
+
+def token_keys(token):
+    # Kunci spesifik 'TIPE:nilai' dicoba lebih dulu, lalu kunci umum 'TIPE'
+    return (f"{token.type}:{token.value.lower()}", token.type)
+
+def lookup(entry, keys):
+    for key in keys:
+        if key in entry:
+            return entry[key]
+    return entry.get(None)
+
+class TableParser:
+    """
+    Melakukan syntax analysis menggunakan tabel LL(1) dan stack eksplisit.
+    """
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.keys = [token_keys(token) for token in tokens]
+        self.token_index = 0
+
+    def keys_at(self, index):
+        return self.keys[index] if index < len(self.keys) else EOF_KEYS
+
+    def current_description(self):
+        if self.token_index < len(self.tokens):
+            token = self.tokens[self.token_index]
+            return f"'{token.value}' ({token.type})"
+        return "None"
+
+    def parse(self):
+        if not self.tokens:
+            return None
+
+        holder = Node(None)
+        nodes = [holder]
+        stack = [(NONTERMINAL, START, False)]
+        tokens = self.tokens
+
+        while stack:
+            item = stack.pop()
+            kind = item[0]
+
+            if kind == TERMINAL or kind == PREDICATE:
+                _, token_type, value = item
+                token = tokens[self.token_index] if self.token_index < len(tokens) else None
+                if token is None or token.type != token_type or \
+                   (value is not None and token.value.lower() != value):
+                    expected_val = f" dengan nilai '{value}'" if value else ""
+                    raise SyntaxError(
+                        f"Error Sintaks: Diharapkan token {token_type}{expected_val}, tetapi ditemukan "
+                        f"{self.current_description()} pada posisi {self.token_index}."
+                    )
+                if kind == TERMINAL:
+                    nodes[-1].children.append(Node(f"{token.type}({token.value})", token=token))
+                    self.token_index += 1
+
+            elif kind == NONTERMINAL:
+                _, name, is_node = item
+                production = lookup(TABLE[name], self.keys_at(self.token_index))
+                if isinstance(production, dict):
+                    production = lookup(production, self.keys_at(self.token_index + 1))
+                if production is None:
+                    raise SyntaxError(
+                        f"Error Sintaks: Diharapkan {name}, ditemukan {self.current_description()} "
+                        f"pada posisi {self.token_index}."
+                    )
+
+                _, symbols, wrap = COMPILED_PRODUCTIONS[production]
+                if is_node:
+                    node = Node(name)
+                    nodes[-1].children.append(node)
+                    nodes.append(node)
+                    stack.append((END_NODE,))
+                if wrap:
+                    # Node sebelum alternatif ini ikut dibungkus
+                    stack.append((WRAP, wrap, len(nodes[-1].children) - 1))
+                stack.extend(symbols)
+
+            elif kind == END_NODE:
+                nodes.pop()
+
+            else:
+                _, name, start = item
+                parent = nodes[-1]
+                wrapped = Node(name)
+                wrapped.children = parent.children[start:]
+                del parent.children[start:]
+                parent.children.append(wrapped)
+
+        return holder.children[0]
+
+# --- BENCHMARK ---
+
+def tree_bytes(root):
+    from serializer import BinaryTreeWriter
+    f = io.BytesIO()
+    writer = BinaryTreeWriter(f)
+    feed(tree_events(root), writer)
+    writer.flush()
+    return f.getvalue()
+
+def recursive_parse(tokens):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Parser(tokens).parse()
+
+def deep_program(depth):
+    # Ekspresi dengan kurung bersarang sedalam depth
+    return f"program Dalam;\nvariabel x: integer;\nmulai\n  x := {'(' * depth}1{')' * depth};\nselesai.\n"
+
+def benchmark(paths, repeat=200, depth=5000):
+    from compiler import PASCAL_S_KEYWORDS
+    from lexer import Lexer
+
+    print(f"{'file':<12}{'token':>7}{'recursive (tok/s)':>20}{'table (tok/s)':>16}{'sama':>6}")
+    for path in paths:
+        with open(path, 'r') as f:
+            tokens = Lexer(None, PASCAL_S_KEYWORDS).run_scanner(f.read())
+
+        results = []
+        for parse in (recursive_parse, lambda t: TableParser(t).parse()):
+            start = time.perf_counter()
+            for _ in range(repeat):
+                tree = parse(tokens)
+            elapsed = time.perf_counter() - start
+            results.append((len(tokens) * repeat / elapsed, tree))
+
+        same = tree_bytes(results[0][1]) == tree_bytes(results[1][1])
+        print(f"{os.path.basename(path):<12}{len(tokens):>7}{results[0][0]:>20,.0f}{results[1][0]:>16,.0f}{'ya' if same else 'TIDAK':>6}")
+
+    tokens = Lexer(None, PASCAL_S_KEYWORDS).run_scanner(deep_program(depth))
+    try:
+        recursive_parse(tokens)
+        recursive = "berhasil"
+    except RecursionError:
+        recursive = "RecursionError"
+    TableParser(tokens).parse()
+    print(f"Nesting kedalaman {depth}: recursive {recursive}, table berhasil")
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "--bench":
+        paths = sys.argv[2:]
+        if not paths:
+            test_dir = os.path.join(os.path.dirname(__file__), "..", "test", "milestone-2", "input")
+            paths = sorted(glob.glob(os.path.join(test_dir, "*.pas")))
+        benchmark(paths)
+        return
+    print("Penggunaan: python table_parser.py --bench [Kode Pascal ...]")
+
+if __name__ == "__main__":
+    main()
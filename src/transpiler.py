@@ -0,0 +1,694 @@
+"""
+Backend yang menurunkan Parse Tree Pascal-S menjadi AST Python, lalu
+meng-compile()-nya menjadi code object yang bisa langsung dieksekusi.
+"""
+import ast
+import contextlib
+import glob
+import hashlib
+import io
+import keyword
+import os
+import sys
+import time
+from lexer import Lexer
+from parser import Parser
+
+# Nama yang dipakai oleh kode hasil transpilasi, tidak boleh tertimpa identifier Pascal
+RESERVED_NAMES = {"range", "str", "int", "float", "len"}
+
+RELATIONAL_OPS = {
+    "=": ast.Eq, "<>": ast.NotEq, "<": ast.Lt,
+    "<=": ast.LtE, ">": ast.Gt, ">=": ast.GtE,
+}
+
+DEFAULT_VALUES = {"integer": 0, "real": 0.0, "boolean": False, "char": ""}
+
+READ_CONVERTERS = {"integer": "int", "real": "float"}
+
+# Node AST yang boleh dievaluasi saat constant folding
+FOLDABLE_NODES = (ast.Constant, ast.BinOp, ast.UnaryOp, ast.operator, ast.unaryop)
+
+class TranspileError(Exception):
+    """
+    Parse tree valid tetapi tidak bisa ditranspilasi, misal sebuah unit tanpa program utama.
+    """
+
+def leaf(node):
+    """
+    Memecah nama node daun 'TYPE(value)' menjadi (TYPE, value).
+    """
+    token_type, _, value = node.name.partition("(")
+    return token_type, value[:-1]
+
+def leaf_value(node):
+    return leaf(node)[1]
+
+def is_leaf(node, token_type, value=None):
+    if node.name.startswith("<"):
+        return False
+    node_type, node_value = leaf(node)
+    return node_type == token_type and (value is None or node_value.lower() == value)
+
+def mangle(name):
+    # Pascal tidak case-sensitive, Python case-sensitive
+    name = name.lower()
+    if keyword.iskeyword(name) or name in RESERVED_NAMES or name.startswith("_"):
+        name += "_"
+    return name
+
+def pascal_string(lexeme):
+    # 'it''s' -> it's
+    return lexeme[1:-1].replace("''", "'")
+
+def name_load(name):
+    return ast.Name(id=name, ctx=ast.Load())
+
+def name_store(name):
+    return ast.Name(id=name, ctx=ast.Store())
+
+def call(func, *args):
+    return ast.Call(func=name_load(func), args=list(args), keywords=[])
+
+def function_def(name, args, body):
+    node = ast.FunctionDef(name=name, args=args, body=body, decorator_list=[], returns=None)
+    if "type_params" in ast.FunctionDef._fields:
+        node.type_params = []
+    return node
+
+def assigned_names(statements):
+    """
+    Mengumpulkan nama variabel yang di-assign di dalam statements,
+    tanpa masuk ke definisi fungsi bersarang.
+    """
+    names = set()
+    stack = list(statements)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.FunctionDef):
+            continue
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+        stack.extend(ast.iter_child_nodes(node))
+    return names
+
+class Symbol:
+    """
+    Informasi satu identifier yang dideklarasikan (variabel, konstanta, parameter, subprogram).
+    """
+    def __init__(self, kind, type=None, value=None):
+        self.kind = kind
+        self.type = type
+        self.value = value
+
+class Transpiler:
+    """
+    Menurunkan Parse Tree hasil Parser menjadi ast.Module.
+
+    Seluruh program dibungkus dalam fungsi _program() sehingga variabel global
+    Pascal menjadi variabel lokal/closure (lebih cepat daripada dict globals),
+    prosedur/fungsi menjadi def bersarang, dan assignment ke variabel luar
+    memakai 'nonlocal'.
+    """
+    def __init__(self):
+        self.scopes = []
+        self.types = {}
+        self.functions = []
+
+    # --- SCOPE ---
+
+    def declare(self, name, symbol):
+        self.scopes[-1][name.lower()] = symbol
+
+    def lookup(self, name):
+        name = name.lower()
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return None
+
+    # --- PROGRAM DAN DEKLARASI ---
+
+    def transpile(self, tree):
+        if tree.name != "<program>":
+            # Unit hanya berisi deklarasi, tidak ada program utama untuk dijalankan
+            raise TranspileError(f"Hanya program yang dapat ditranspilasi, bukan {tree.name}")
+        parts = {child.name: child for child in tree.children}
+        if "<uses-clause>" in parts:
+            # Unit tidak ikut ditranspilasi, identifier dari unit tidak akan terdefinisi
+            raise TranspileError("Program yang memakai 'gunakan' tidak dapat ditranspilasi")
+        self.scopes = [{}]
+        declarations, compound = parts["<declaration-part>"], parts["<compound-statement>"]
+        body = self.declaration_part(declarations)
+        body.extend(self.compound_statement(compound))
+
+        program = function_def("_program", self.arguments([]), body or [ast.Pass()])
+        module = ast.Module(body=[program, ast.Expr(call("_program"))], type_ignores=[])
+        return ast.fix_missing_locations(module)
+
+    def arguments(self, names):
+        return ast.arguments(
+            posonlyargs=[], args=[ast.arg(arg=name) for name in names], vararg=None,
+            kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[],
+        )
+
+    def declaration_part(self, node):
+        statements = []
+        for child in node.children:
+            if child.name == "<var-declaration>":
+                statements.extend(self.var_declaration(child))
+            elif child.name == "<const-declaration>":
+                self.const_declaration(child)
+            elif child.name == "<type-declaration>":
+                self.type_declaration(child)
+            elif child.name == "<subprogram-declaration>":
+                for subprogram in child.children:
+                    statements.append(self.subprogram(subprogram))
+        return statements
+
+    def var_declaration(self, node):
+        statements = []
+        children = node.children[1:]
+        for i in range(0, len(children), 4):
+            identifiers, type_node = children[i], children[i + 2]
+            var_type = self.resolve_type(type_node)
+            for identifier in identifiers.children[::2]:
+                name = leaf_value(identifier)
+                self.declare(name, Symbol("var", var_type))
+                statements.append(ast.Assign(
+                    targets=[name_store(mangle(name))], value=self.default_value(var_type),
+                ))
+        return statements
+
+    def const_declaration(self, node):
+        # Konstanta selalu NUMBER, jadi langsung di-inline sebagai ast.Constant
+        children = node.children[1:]
+        for i in range(0, len(children), 4):
+            name = leaf_value(children[i])
+            value, value_type = self.number(leaf_value(children[i + 2]))
+            self.declare(name, Symbol("const", value_type, value))
+
+    def type_declaration(self, node):
+        children = node.children[1:]
+        for i in range(0, len(children), 4):
+            self.types[leaf_value(children[i]).lower()] = self.resolve_type(children[i + 2])
+
+    def resolve_type(self, node):
+        """
+        Mengembalikan tipe dasar ('integer', 'real', ...) atau
+        tuple ('array', low, high, tipe_elemen) untuk larik.
+        """
+        first = node.children[0]
+        if is_leaf(first, "KEYWORD", "larik"):
+            range_node = node.children[2]
+            low, _ = self.expression(range_node.children[0])
+            high, _ = self.expression(range_node.children[2])
+            return ("array", low, high, self.resolve_type(node.children[5]))
+        if is_leaf(first, "KEYWORD"):
+            return leaf_value(first).lower()
+        if first.name == "<subrange-type>":
+            return "integer"
+
+        # Nama tipe hasil deklarasi 'tipe'
+        type_name = self.simple_identifier(first)
+        if type_name and type_name.lower() in self.types:
+            return self.types[type_name.lower()]
+        return None
+
+    def simple_identifier(self, expression):
+        node = expression
+        while node.name.startswith("<") and len(node.children) == 1:
+            node = node.children[0]
+        return leaf_value(node) if is_leaf(node, "IDENTIFIER") else None
+
+    def default_value(self, var_type):
+        if isinstance(var_type, tuple):
+            _, low, high, element_type = var_type
+            size = ast.BinOp(left=ast.BinOp(left=high, op=ast.Sub(), right=low), op=ast.Add(), right=ast.Constant(1))
+            size = self.fold(size)
+            element = self.default_value(element_type)
+            if isinstance(element, ast.Constant):
+                # Larik skalar dialokasikan sekaligus: [0] * n
+                return ast.BinOp(left=ast.List(elts=[element], ctx=ast.Load()), op=ast.Mult(), right=size)
+            return ast.ListComp(elt=element, generators=[ast.comprehension(
+                target=name_store("_"), iter=call("range", size), ifs=[], is_async=0,
+            )])
+        return ast.Constant(DEFAULT_VALUES.get(var_type, 0))
+
+    def fold(self, expr):
+        # Constant folding sederhana untuk batas larik, hanya untuk ekspresi yang
+        # seluruhnya konstanta dan operator aritmatika (tanpa nama atau pemanggilan)
+        if not all(isinstance(node, FOLDABLE_NODES) for node in ast.walk(expr)):
+            return expr
+        try:
+            code = compile(ast.fix_missing_locations(ast.Expression(expr)), "<fold>", "eval")
+            return ast.Constant(eval(code, {"__builtins__": {}}))
+        except Exception:
+            return expr
+
+    def subprogram(self, node):
+        is_function = node.name == "<function-declaration>"
+        name = leaf_value(node.children[1])
+        index = 2
+
+        params = []
+        if node.children[index].name == "<formal-parameter-list>":
+            params = self.formal_parameters(node.children[index])
+            index += 1
+
+        return_type = None
+        if is_function:
+            return_type = self.resolve_type(node.children[index + 1])
+            index += 2
+
+        self.declare(name, Symbol("function" if is_function else "procedure", return_type, len(params)))
+        self.scopes.append({})
+        self.functions.append(name.lower() if is_function else None)
+
+        for param_name, param_type in params:
+            self.declare(param_name, Symbol("var", param_type))
+        body = self.declaration_part(node.children[index + 1])
+        if is_function:
+            body.insert(0, ast.Assign(targets=[name_store("_result")], value=self.default_value(return_type)))
+        body.extend(self.compound_statement(node.children[index + 2]))
+        if is_function:
+            body.append(ast.Return(value=name_load("_result")))
+
+        # Nama yang di-assign tetapi bukan lokal harus dideklarasikan di scope luar,
+        # kecuali nama berawalan '_' yang merupakan variabel bantu lokal hasil transpilasi
+        local_names = {mangle(n) for n in self.scopes[-1]}
+        enclosing_names = {mangle(n) for scope in self.scopes[:-1] for n in scope}
+        outer = []
+        for assigned in sorted(assigned_names(body) - local_names):
+            if assigned in enclosing_names:
+                outer.append(assigned)
+            elif not assigned.startswith("_"):
+                raise TranspileError(f"identifier '{assigned}' tidak dideklarasikan")
+        if outer:
+            body.insert(0, ast.Nonlocal(names=outer))
+
+        self.functions.pop()
+        self.scopes.pop()
+        return function_def(mangle(name), self.arguments([mangle(p) for p, _ in params]), body or [ast.Pass()])
+
+    def formal_parameters(self, node):
+        params = []
+        for group in node.children[1:-1:2]:
+            param_type = self.resolve_type(group.children[2])
+            for identifier in group.children[0].children[::2]:
+                params.append((leaf_value(identifier), param_type))
+        return params
+
+    # --- STATEMENT ---
+
+    def compound_statement(self, node):
+        return self.statement_list(node.children[1])
+
+    def statement_list(self, node):
+        statements = []
+        for child in node.children:
+            if child.name.startswith("<"):
+                statements.extend(self.statement(child))
+        return statements
+
+    def block(self, node):
+        return self.statement(node) or [ast.Pass()]
+
+    def statement(self, node):
+        kind = node.name
+        if kind == "<compound-statement>":
+            return self.compound_statement(node)
+        if kind == "<assignment-statement>":
+            return [self.assignment_statement(node)]
+        if kind == "<procedure-call>":
+            return [self.procedure_call(node)]
+        if kind == "<if-statement>":
+            return [self.if_statement(node)]
+        if kind == "<while-statement>":
+            return [self.while_statement(node)]
+        if kind == "<for-statement>":
+            return self.for_statement(node)
+        return []
+
+    def target(self, name_node, index_node=None):
+        name = leaf_value(name_node)
+        if self.functions and self.functions[-1] == name.lower():
+            return name_store("_result")
+        if index_node is None:
+            return name_store(mangle(name))
+        return ast.Subscript(value=name_load(mangle(name)), slice=self.array_index(name, index_node), ctx=ast.Store())
+
+    def array_index(self, name, index_node):
+        index, _ = self.expression(index_node)
+        symbol = self.lookup(name)
+        if symbol and isinstance(symbol.type, tuple):
+            low = symbol.type[1]
+            if not (isinstance(low, ast.Constant) and low.value == 0):
+                return self.fold_index(ast.BinOp(left=index, op=ast.Sub(), right=low))
+        return index
+
+    def fold_index(self, expr):
+        # i - 1 tetap, tapi 3 - 1 langsung menjadi 2
+        if isinstance(expr.left, ast.Constant) and isinstance(expr.right, ast.Constant):
+            return self.fold(expr)
+        return expr
+
+    def assignment_statement(self, node):
+        children = node.children
+        index_node = children[2] if len(children) == 6 else None
+        value, _ = self.expression(children[-1])
+        return ast.Assign(targets=[self.target(children[0], index_node)], value=value)
+
+    def procedure_call(self, node):
+        name = leaf_value(node.children[0])
+        args = []
+        if node.children[2].name == "<parameter-list>":
+            args = node.children[2].children[::2]
+
+        lowered = name.lower()
+        if lowered in ("writeln", "write"):
+            return ast.Expr(call("_write", self.format_output(args, lowered == "writeln")))
+        if lowered in ("readln", "read"):
+            return self.read_statement(args)
+        return ast.Expr(ast.Call(
+            func=name_load(mangle(name)), args=[self.expression(a)[0] for a in args], keywords=[],
+        ))
+
+    def format_output(self, args, newline):
+        """
+        writeln(a, b) -> _write(f'{a}{b}\\n'), satu kali append ke buffer output.
+        """
+        values = []
+        for arg in args:
+            expr, expr_type = self.expression(arg)
+            if isinstance(expr, ast.Constant) and isinstance(expr.value, str):
+                values.append(expr)
+            elif expr_type in ("integer", "real", "char", "string"):
+                values.append(ast.FormattedValue(value=expr, conversion=-1, format_spec=None))
+            else:
+                values.append(ast.FormattedValue(value=call("_str", expr), conversion=-1, format_spec=None))
+        if newline:
+            values.append(ast.Constant("\n"))
+
+        if all(isinstance(v, ast.Constant) for v in values):
+            return ast.Constant("".join(v.value for v in values))
+        return ast.JoinedStr(values=values)
+
+    def read_statement(self, args):
+        targets, converters = [], []
+        for arg in args:
+            factor = arg
+            while factor.name != "<factor>":
+                factor = factor.children[0]
+            name_node = factor.children[0]
+            index_node = factor.children[2] if len(factor.children) == 4 else None
+            symbol = self.lookup(leaf_value(name_node))
+            var_type = symbol.type if symbol else None
+            if isinstance(var_type, tuple):
+                var_type = var_type[3]
+            targets.append(self.target(name_node, index_node))
+            converters.append(name_load(READ_CONVERTERS.get(var_type, "str")))
+
+        value = call("_readln", ast.Tuple(elts=converters, ctx=ast.Load()))
+        return ast.Assign(targets=[ast.Tuple(elts=targets, ctx=ast.Store())], value=value)
+
+    def if_statement(self, node):
+        children = node.children
+        test, _ = self.expression(children[1])
+        orelse = self.statement(children[5]) if len(children) == 6 else []
+        return ast.If(test=test, body=self.block(children[3]), orelse=orelse)
+
+    def while_statement(self, node):
+        test, _ = self.expression(node.children[1])
+        return ast.While(test=test, body=self.block(node.children[3]), orelse=[])
+
+    def for_statement(self, node):
+        """
+        untuk i := a ke b -> for i in range(a, b + 1) jika batasnya integer dan
+        i tidak di-assign di dalam body. Selain itu diturunkan menjadi while.
+        """
+        children = node.children
+        name = leaf_value(children[1])
+        downto = is_leaf(children[4], "KEYWORD", "turun_ke")
+        start, start_type = self.expression(children[3])
+        stop, stop_type = self.expression(children[5])
+        body = self.block(children[7])
+        var = mangle(name)
+
+        if start_type == "integer" and stop_type == "integer" and var not in assigned_names(body):
+            if downto:
+                bounds = [start, self.fold_index(ast.BinOp(left=stop, op=ast.Sub(), right=ast.Constant(1))), ast.Constant(-1)]
+            else:
+                bounds = [start, self.fold_index(ast.BinOp(left=stop, op=ast.Add(), right=ast.Constant(1)))]
+            return [ast.For(target=name_store(var), iter=call("range", *bounds), body=body, orelse=[])]
+
+        # Fallback: batas dievaluasi sekali, lalu while dengan _succ/_pred
+        limit = f"_limit_{var}"
+        compare = ast.GtE() if downto else ast.LtE()
+        step = "_pred" if downto else "_succ"
+        return [
+            ast.Assign(targets=[name_store(var)], value=start),
+            ast.Assign(targets=[name_store(limit)], value=stop),
+            ast.While(
+                test=ast.Compare(left=name_load(var), ops=[compare], comparators=[name_load(limit)]),
+                body=body + [ast.Assign(targets=[name_store(var)], value=call(step, name_load(var)))],
+                orelse=[],
+            ),
+        ]
+
+    # --- EKSPRESI ---
+    # Setiap method mengembalikan (ast.expr, tipe statis atau None)
+
+    def expression(self, node):
+        children = node.children
+        left, left_type = self.simple_expression(children[0])
+        if len(children) == 1:
+            return left, left_type
+        op = RELATIONAL_OPS[leaf_value(children[1])]()
+        right, _ = self.simple_expression(children[2])
+        return ast.Compare(left=left, ops=[op], comparators=[right]), "boolean"
+
+    def simple_expression(self, node):
+        children = node.children
+        sign = None
+        if not children[0].name.startswith("<"):
+            sign = leaf_value(children[0])
+            children = children[1:]
+
+        result, result_type = self.term(children[0])
+        if sign == "-":
+            result = ast.UnaryOp(op=ast.USub(), operand=result)
+
+        for i in range(1, len(children), 2):
+            op = leaf_value(children[i]).lower()
+            right, right_type = self.term(children[i + 1])
+            if op == "atau":
+                result, result_type = ast.BoolOp(op=ast.Or(), values=[result, right]), "boolean"
+            else:
+                py_op = ast.Add() if op == "+" else ast.Sub()
+                result = ast.BinOp(left=result, op=py_op, right=right)
+                result_type = self.numeric_type(result_type, right_type)
+        return result, result_type
+
+    def term(self, node):
+        children = node.children
+        result, result_type = self.factor(children[0])
+        for i in range(1, len(children), 2):
+            op = leaf_value(children[i]).lower()
+            right, right_type = self.factor(children[i + 1])
+            if op == "dan":
+                result, result_type = ast.BoolOp(op=ast.And(), values=[result, right]), "boolean"
+            elif op == "*":
+                result = ast.BinOp(left=result, op=ast.Mult(), right=right)
+                result_type = self.numeric_type(result_type, right_type)
+            elif op == "/":
+                result, result_type = ast.BinOp(left=result, op=ast.Div(), right=right), "real"
+            else:
+                # bagi/mod Pascal membulatkan ke arah nol, beda dengan // dan % Python
+                result, result_type = call("_div" if op == "bagi" else "_mod", result, right), "integer"
+        return result, result_type
+
+    def numeric_type(self, left, right):
+        if left == "integer" and right == "integer":
+            return "integer"
+        if left in ("integer", "real") and right in ("integer", "real"):
+            return "real"
+        return None
+
+    def number(self, lexeme):
+        if "." in lexeme or "e" in lexeme.lower():
+            return float(lexeme), "real"
+        return int(lexeme), "integer"
+
+    def factor(self, node):
+        first = node.children[0]
+
+        if first.name == "<function-call>":
+            return self.function_call(first)
+
+        if len(node.children) == 1:
+            token_type, value = leaf(first)
+            if token_type == "IDENTIFIER":
+                return self.identifier(value)
+            if token_type == "NUMBER":
+                number, number_type = self.number(value)
+                return ast.Constant(number), number_type
+            if token_type == "STRING_LITERAL":
+                return ast.Constant(pascal_string(value)), "string"
+            if token_type == "CHAR_LITERAL":
+                return ast.Constant(pascal_string(value)), "char"
+            if token_type == "KEYWORD":
+                return ast.Constant(value.lower() == "true"), "boolean"
+
+        if is_leaf(first, "LOGICAL_OPERATOR"):
+            operand, _ = self.factor(node.children[1])
+            return ast.UnaryOp(op=ast.Not(), operand=operand), "boolean"
+
+        if is_leaf(first, "LPARENTHESIS"):
+            return self.expression(node.children[1])
+
+        # Akses larik: ID [ expression ]
+        name = leaf_value(first)
+        symbol = self.lookup(name)
+        element_type = symbol.type[3] if symbol and isinstance(symbol.type, tuple) else None
+        subscript = ast.Subscript(value=name_load(mangle(name)), slice=self.array_index(name, node.children[2]), ctx=ast.Load())
+        return subscript, element_type
+
+    def identifier(self, name):
+        symbol = self.lookup(name)
+        if symbol is None:
+            return name_load(mangle(name)), None
+        if symbol.kind == "const":
+            return ast.Constant(symbol.value), symbol.type
+        if symbol.kind == "function":
+            # Nama fungsi tanpa kurung berarti pemanggilan tanpa argumen
+            return call(mangle(name)), symbol.type
+        return name_load(mangle(name)), symbol.type
+
+    def function_call(self, node):
+        name = leaf_value(node.children[0])
+        args = []
+        if node.children[2].name == "<parameter-list>":
+            args = [self.expression(a)[0] for a in node.children[2].children[::2]]
+        symbol = self.lookup(name)
+        return ast.Call(func=name_load(mangle(name)), args=args, keywords=[]), symbol.type if symbol else None
+
+# --- RUNTIME ---
+
+def _div(a, b):
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+def _mod(a, b):
+    return a - b * _div(a, b)
+
+def _str(value):
+    if value is True:
+        return "TRUE"
+    if value is False:
+        return "FALSE"
+    return str(value)
+
+def _succ(value):
+    return chr(ord(value) + 1) if isinstance(value, str) else value + 1
+
+def _pred(value):
+    return chr(ord(value) - 1) if isinstance(value, str) else value - 1
+
+def make_reader(stream):
+    def _readln(converters):
+        line = stream.readline().split()
+        return tuple(convert(part) for convert, part in zip(converters, line))
+    return _readln
+
+# --- COMPILE DAN CACHE ---
+
+_code_cache = {}
+
+def parse_source(source):
+    # Import di sini supaya compiler.py bisa meng-import modul ini tanpa siklus
+    from compiler import PASCAL_S_KEYWORDS
+
+    tokens = Lexer(None, PASCAL_S_KEYWORDS).run_scanner(source)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Parser(tokens).parse()
+
+def compile_source(source, filename="<pascal-s>"):
+    """
+    Mengembalikan code object untuk source Pascal-S.
+    Code object di-cache berdasarkan hash SHA-256 dari source.
+    """
+    key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    code = _code_cache.get(key)
+    if code is None:
+        module = Transpiler().transpile(parse_source(source))
+        code = compile(module, filename, "exec")
+        _code_cache[key] = code
+    return code
+
+def run_code(code, stdin=None):
+    """
+    Mengeksekusi code object hasil compile_source dan mengembalikan output program.
+    """
+    output = []
+    env = {
+        "__builtins__": __builtins__,
+        "_write": output.append,
+        "_readln": make_reader(stdin or sys.stdin),
+        "_div": _div, "_mod": _mod, "_str": _str, "_succ": _succ, "_pred": _pred,
+    }
+    exec(code, env)
+    return "".join(output)
+
+def run_source(source, stdin=None):
+    return run_code(compile_source(source), stdin)
+
+# --- BENCHMARK ---
+
+def benchmark(paths, repeat=1000):
+    """
+    Membandingkan waktu pipeline penuh (lex + parse + transpile + compile + eksekusi)
+    dengan eksekusi ulang code object yang sudah di-cache.
+    """
+    print(f"{'file':<12}{'cold (ms)':>12}{'cached (us)':>14}{'speedup':>10}")
+    for path in paths:
+        with open(path, 'r') as f:
+            source = f.read()
+
+        start = time.perf_counter()
+        _code_cache.clear()
+        run_source(source)
+        cold = time.perf_counter() - start
+
+        code = compile_source(source)
+        start = time.perf_counter()
+        for _ in range(repeat):
+            run_code(code)
+        cached = (time.perf_counter() - start) / repeat
+
+        print(f"{os.path.basename(path):<12}{cold * 1e3:>12.3f}{cached * 1e6:>14.2f}{cold / cached:>9.0f}x")
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "--bench":
+        paths = sys.argv[2:]
+        if not paths:
+            test_dir = os.path.join(os.path.dirname(__file__), "..", "test", "milestone-2", "input")
+            paths = sorted(glob.glob(os.path.join(test_dir, "*.pas")))
+        benchmark(paths)
+        return
+
+    if len(sys.argv) != 2:
+        print("Penggunaan: python transpiler.py [Kode Pascal] | --bench [Kode Pascal ...]")
+        return
+
+    with open(sys.argv[1], 'r') as f:
+        source = f.read()
+    try:
+        sys.stdout.write(run_source(source, sys.stdin))
+    except SyntaxError as e:
+        print(f"\n[PARSING GAGAL] {e}")
+    except TranspileError as e:
+        print(f"\n[TRANSPILE GAGAL] {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Index parse tree untuk query cepat (cross-reference, rename, pencarian assignment).
+
+Index dibangun dalam satu traversal dan menyimpan:
+- node dalam urutan pre-order beserta parent-nya,
+- rentang token (first, last) untuk setiap subtree,
+- posisi (baris, kolom) setiap token,
+- daftar node per jenis produksi dan per nama identifier (case-folded),
+- daftar node produksi per (jenis, nama identifier di anak pertamanya), untuk
+  query seperti assignments_to dan calls_to.
+"""
+import json
+
+def head_key(kind, name):
+    # Kunci string (bukan tuple) supaya index bisa ditulis sebagai JSON
+    return f"{kind} {name}"
+
+class TreeIndex:
+    """
+    Index hasil satu kali traversal parse tree. Semua query mengembalikan
+    list node dengan biaya sebanding jumlah hasil.
+    """
+    def __init__(self, root):
+        self.root = root
+        self.nodes = []
+        self.order = {}        # id(node) -> nomor pre-order
+        self.parents = []      # nomor pre-order parent, -1 untuk root
+        self.ranges = []       # (token pertama, token terakhir); last < first jika kosong
+        self.positions = []    # (baris, kolom) per urutan token
+        self.productions = {}  # '<assignment-statement>' -> [nomor pre-order]
+        self.identifiers = {}  # nama identifier (lowercase) -> [nomor pre-order]
+        self.heads = {}        # '<jenis> nama' -> [nomor pre-order node produksi]
+        if root is not None:
+            self.build(root)
+
+    def build(self, root):
+        # Stack berisi (node, parent) untuk enter, dan (None, nomor) untuk exit
+        stack = [(root, -1)]
+        while stack:
+            node, parent = stack.pop()
+            if node is None:
+                first, _ = self.ranges[parent]
+                self.ranges[parent] = (first, len(self.positions) - 1)
+                continue
+
+            number = len(self.nodes)
+            self.nodes.append(node)
+            self.order[id(node)] = number
+            self.parents.append(parent)
+            self.ranges.append((len(self.positions), len(self.positions) - 1))
+
+            if node.name.startswith("<"):
+                self.productions.setdefault(node.name, []).append(number)
+                stack.append((None, number))
+                for child in reversed(node.children):
+                    stack.append((child, number))
+                continue
+
+            # Node daun = satu token
+            token = node.token
+            token_index = len(self.positions)
+            self.positions.append((token.line, token.column) if token else (None, None))
+            self.ranges[number] = (token_index, token_index)
+            if node.name.startswith("IDENTIFIER("):
+                name = node.name[len("IDENTIFIER("):-1].lower()
+                self.identifiers.setdefault(name, []).append(number)
+                if parent >= 0 and self.nodes[parent].children[0] is node:
+                    key = head_key(self.nodes[parent].name, name)
+                    self.heads.setdefault(key, []).append(parent)
+
+    # --- QUERY ---
+
+    def number(self, node):
+        return self.order[id(node)]
+
+    def find(self, kind):
+        """
+        Semua node dengan jenis produksi tertentu, misal '<procedure-call>'.
+        """
+        return [self.nodes[i] for i in self.productions.get(kind, [])]
+
+    def identifier(self, name):
+        """
+        Semua node daun IDENTIFIER dengan nama tertentu (tidak case-sensitive).
+        """
+        return [self.nodes[i] for i in self.identifiers.get(name.lower(), [])]
+
+    def parent(self, node):
+        parent = self.parents[self.number(node)]
+        return self.nodes[parent] if parent >= 0 else None
+
+    def token_range(self, node):
+        return self.ranges[self.number(node)]
+
+    def position(self, node):
+        """
+        Posisi (baris, kolom) token pertama subtree, atau None untuk subtree kosong.
+        """
+        first, last = self.token_range(node)
+        return self.positions[first] if first <= last else None
+
+    def uses(self, name, kind):
+        """
+        Node produksi 'kind' yang anak pertamanya adalah identifier 'name'.
+        """
+        return [self.nodes[i] for i in self.heads.get(head_key(kind, name.lower()), [])]
+
+    def assignments_to(self, name):
+        return self.uses(name, "<assignment-statement>")
+
+    def calls_to(self, name):
+        return self.uses(name, "<procedure-call>") + self.uses(name, "<function-call>")
+
+    # --- SERIALISASI ---
+
+    def to_dict(self):
+        return {
+            "parents": self.parents,
+            "ranges": self.ranges,
+            "positions": self.positions,
+            "productions": self.productions,
+            "identifiers": self.identifiers,
+            "heads": self.heads,
+        }
+
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path, root):
+        """
+        Memuat index yang ditulis oleh write() untuk tree yang sama
+        (misalnya hasil serializer.read_tree), tanpa membangun ulang index.
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        index = cls(None)
+        index.root = root
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            index.order[id(node)] = len(index.nodes)
+            index.nodes.append(node)
+            stack.extend(reversed(node.children))
+
+        index.parents = data["parents"]
+        index.ranges = [tuple(r) for r in data["ranges"]]
+        index.positions = [tuple(p) for p in data["positions"]]
+        index.productions = data["productions"]
+        index.identifiers = data["identifiers"]
+        index.heads = data["heads"]
+        if len(index.nodes) != len(index.parents):
+            raise ValueError(f"Index '{path}' tidak cocok dengan parse tree")
+        return index
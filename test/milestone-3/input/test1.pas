@@ -0,0 +1,6 @@
+unit Tetapan;
+
+konstanta
+  BATAS = 10;
+
+selesai.
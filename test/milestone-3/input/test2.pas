@@ -0,0 +1,15 @@
+unit Matematika;
+
+gunakan Tetapan;
+
+fungsi kuadrat(x: integer): integer;
+mulai
+  kuadrat := x * x;
+selesai;
+
+fungsi dalam_batas(x: integer): boolean;
+mulai
+  dalam_batas := x <= BATAS;
+selesai;
+
+selesai.
@@ -0,0 +1,12 @@
+program Hitung;
+
+gunakan Tetapan, Matematika;
+
+variabel
+  i: integer;
+
+mulai
+  untuk i := 1 ke BATAS lakukan
+    jika dalam_batas(kuadrat(i)) maka
+      writeln(i, ' kuadrat = ', kuadrat(i));
+selesai.